@@ -0,0 +1,154 @@
+"""
+Throughput of the pipelined streaming driver against the synchronous run path.
+
+Frames live in a local Redis stand-in: fakeredis when installed, otherwise a dict
+store. Either way frames cross it as serialized bytes and every round trip sleeps for
+--latency milliseconds, standing in for the network hop to a Redis server.
+
+Each frame gets its own detections. Besides timing them, the script checks that the
+run_async and streaming paths answer frames in input order and store the same frames,
+byte for byte, as the synchronous path, and exits with status 1 when they do not.
+
+    python benchmarks/async_pipeline.py [--frame 1080p] [--detections 200] [--frames 60] [--latency 3]
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+class DictRedis:
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, payload):
+        self.values[key] = bytes(payload)
+
+    def get(self, key):
+        return self.values[key]
+
+
+def redis_stand_in():
+    try:
+        import fakeredis
+    except ImportError:
+        return DictRedis(), "dict store"
+    return fakeredis.FakeRedis(), "fakeredis"
+
+
+class RedisImage:
+    """
+    Image.get_frame/Image.set_frame replacement that round-trips frames through a Redis client.
+    """
+    redis = None
+    shapes = {}
+    latency = 0.0
+
+    @classmethod
+    def put(cls, uid, value):
+        cls.shapes[uid] = value.shape
+        cls.redis.set(uid, value.tobytes())
+
+    @classmethod
+    def get_frame(cls, img, redis_db=None):
+        time.sleep(cls.latency)
+        frame = img.model_copy()
+        frame.value = np.frombuffer(cls.redis.get(img.uID), dtype=np.uint8).reshape(cls.shapes[img.uID]).copy()
+        return frame
+
+    @classmethod
+    def set_frame(cls, img, package_uID=None, redis_db=None):
+        time.sleep(cls.latency)
+        cls.redis.set(img.uID, img.value.tobytes())
+        stored = img.model_copy()
+        stored.value = None
+        return stored
+
+
+def build_components(executor, image_model, frame_detections, shape):
+    params = {"ConfigColorAxis": "Track", "ConfigColorPalette": "tab20", "ConfigPaletteSize": 20,
+              "ConfigThickness": 2, "ConfigRadius": 0}
+    blank = np.zeros(shape, dtype=np.uint8)
+    bootstrap = executor.DrawBoundingRectangle.bootstrap({})
+    components = []
+    for idx, detections in enumerate(frame_detections):
+        uid = f"frame-{idx}"
+        RedisImage.put(uid, blank)
+        image = image_model(uID=uid, name=uid)
+        components.append(standins.component(executor, params, detections, image=image, bootstrap=bootstrap))
+    return components
+
+
+async def run_async(components):
+    return [await component.run_async() for component in components]
+
+
+async def run_stream(streaming, components):
+    return [response async for response in streaming.stream(components)]
+
+
+def stored_frames(count):
+    return [RedisImage.redis.get(f"frame-{idx}") for idx in range(count)]
+
+
+def response_uids(responses):
+    return [response.executor.value.value.outputs.outputImage.value.uID for response in responses]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--detections", type=int, default=200)
+    parser.add_argument("--vertices", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=3.0, help="simulated Redis round trip in ms")
+    args = parser.parse_args()
+
+    executor = standins.install()
+    executor.Image = RedisImage
+    streaming = importlib.import_module("components.DrawBoundingRectangle.src.utils.streaming")
+    image_model = importlib.import_module("sdks.novavision.src.base.model").Image
+    RedisImage.redis, store_name = redis_stand_in()
+    RedisImage.latency = args.latency / 1e3
+    shape = FRAMES[args.frame]
+    frame_detections = [synthetic_detections(args.detections, args.vertices, shape, seed=idx) for idx in range(args.frames)]
+
+    print(f"{args.frame}, {args.detections} detections, {args.frames} frames, {store_name}, {args.latency:.1f} ms per round trip")
+    results, outputs = {}, {}
+    for name in ("sync", "async", "stream"):
+        components = build_components(executor, image_model, frame_detections, shape)
+        start = time.perf_counter()
+        if name == "sync":
+            responses = [component.run() for component in components]
+        elif name == "async":
+            responses = asyncio.run(run_async(components))
+        else:
+            responses = asyncio.run(run_stream(streaming, components))
+        elapsed = time.perf_counter() - start
+        results[name] = args.frames / elapsed
+        outputs[name] = response_uids(responses), stored_frames(args.frames)
+        print(f"{name:<7}{results[name]:>8.1f} fps")
+    print(f"speedup {results['stream'] / results['sync']:.2f}x")
+
+    failed = False
+    for name in ("async", "stream"):
+        same_order = outputs[name][0] == outputs["sync"][0]
+        same_frames = outputs[name][1] == outputs["sync"][1]
+        print(f"{name} matches sync: order {same_order}, frames {same_frames}")
+        failed |= not (same_order and same_frames)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
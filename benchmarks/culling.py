@@ -0,0 +1,64 @@
+"""
+Draw time with and without culling on sparse-ROI workloads.
+
+Spreads the detections over a canvas --spread times the frame's width and height,
+as tiled inference over a larger scene delivers them, so only about 1 / spread**2 of
+them touch the frame. Reports the draw time per frame with ConfigCulling off and on,
+how many detections were culled, and whether both covered the same pixels.
+
+    python benchmarks/culling.py [--detections 2000] [--vertices 200] [--spread 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+def draw_time(executor, culling, detections, shape, iterations):
+    params = {"ConfigColorAxis": "Track", "ConfigColorPalette": "tab20", "ConfigPaletteSize": 20,
+              "ConfigThickness": 2, "ConfigRadius": 0, "ConfigCulling": culling, "ConfigMetrics": "Enabled"}
+    drawer = standins.component(executor, params, detections)
+    frame = np.zeros(shape, dtype=np.uint8)
+    timings = []
+    for _ in range(iterations):
+        frame[:] = 0
+        color_dict = drawer.select_color()
+        start = time.perf_counter()
+        drawer.draw_bounding_rectangle(frame, color_dict)
+        timings.append(time.perf_counter() - start)
+    culled = drawer.metrics.counts["culled"] // iterations if drawer.metrics.enabled else 0
+    return min(timings), culled, frame.any(axis=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--detections", type=int, default=2000)
+    parser.add_argument("--vertices", type=int, default=200)
+    parser.add_argument("--spread", type=int, default=3, help="canvas size in frames per side")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    executor = standins.install()
+    shape = FRAMES[args.frame]
+    canvas = (shape[0] * args.spread, shape[1] * args.spread, 3)
+    detections = synthetic_detections(args.detections, args.vertices, canvas)
+    print(f"{args.frame}, {args.detections} detections over {args.spread}x{args.spread} frames, {args.vertices} vertices")
+    print(f"{'culling':<10}{'draw ms':>10}{'culled':>8}  same coverage")
+    reference = None
+    for culling in ("Disabled", "Enabled"):
+        seconds, culled, coverage = draw_time(executor, culling, detections, shape, args.iterations)
+        reference = coverage if reference is None else reference
+        print(f"{culling:<10}{seconds * 1e3:>10.2f}{culled:>8}  {np.array_equal(coverage, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Draw time of individual boxes against the density heatmap as detections grow.
+
+Draws the same synthetic detections with ConfigDensity 'Disabled' and 'Always' and
+reports the time per frame of each, showing where the heatmap threshold pays off.
+
+    python benchmarks/density_heatmap.py [--counts 500 2000 10000] [--vertices 50] [--cell 16]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+def draw_time(executor, density, detections, shape, cell, iterations):
+    params = {"ConfigColorAxis": "Track", "ConfigColorPalette": "turbo", "ConfigPaletteSize": 16,
+              "ConfigThickness": 2, "ConfigRadius": 0, "ConfigDensity": density, "ConfigDensityCell": cell}
+    drawer = standins.component(executor, params, detections)
+    frame = np.zeros(shape, dtype=np.uint8)
+    timings = []
+    for _ in range(iterations):
+        color_dict = drawer.select_color()
+        start = time.perf_counter()
+        drawer.draw_bounding_rectangle(frame, color_dict)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--counts", type=int, nargs="+", default=[500, 2000, 10000])
+    parser.add_argument("--vertices", type=int, default=50)
+    parser.add_argument("--cell", type=int, default=16, help="heatmap cell side in pixels")
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    executor = standins.install()
+    shape = FRAMES[args.frame]
+    print(f"{args.frame}, {args.vertices} vertices, {args.cell} px cells")
+    print(f"{'detections':>10}{'boxes ms':>10}{'heatmap ms':>12}")
+    for count in args.counts:
+        detections = synthetic_detections(count, args.vertices, shape)
+        boxes = draw_time(executor, "Disabled", detections, shape, args.cell, args.iterations)
+        heatmap = draw_time(executor, "Always", detections, shape, args.cell, args.iterations)
+        print(f"{count:>10}{boxes * 1e3:>10.2f}{heatmap * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark suite for DrawBoundingRectangle.
+
+Drives load_detections, select_color and draw_bounding_rectangle directly on synthetic
+workloads, with the SDK's Image/Redis layer replaced by local stand-ins. Every case
+reports per-frame latency percentiles, throughput and peak traced memory.
+
+    python benchmarks/draw_bounding_rectangle.py                      # default matrix
+    python benchmarks/draw_bounding_rectangle.py --quick              # small smoke matrix
+    python benchmarks/draw_bounding_rectangle.py --save base.json     # record a baseline
+    python benchmarks/draw_bounding_rectangle.py --compare base.json  # flag regressions
+
+Cases can be narrowed with --frames, --counts, --vertices and --axes; a vertex count of
+0 means bbox-only detections.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+
+FRAMES = {"1080p": (1080, 1920, 3), "4K": (2160, 3840, 3)}
+COUNTS = (10, 100, 500, 2000)
+VERTICES = (0, 50, 500, 2000)
+AXES = ("Class", "Index", "Track")
+
+
+def synthetic_detections(count, vertices, shape, seed=0):
+    """
+    Detections as the upstream JSON delivers them: dicts with a boundingBox and, when
+    vertices > 0, a keyPoints polygon tracing a rotated ellipse inside the box.
+    """
+    rng = np.random.default_rng(seed)
+    height, width = shape[:2]
+    sizes = rng.uniform(0.01, 0.08, (count, 2)) * (width, height)
+    lefts = rng.uniform(0, width - sizes[:, 0])
+    tops = rng.uniform(0, height - sizes[:, 1])
+    detections = []
+    for idx in range(count):
+        detection = {
+            "classId": int(rng.integers(0, 80)),
+            "classLabel": "object",
+            "confidence": float(rng.uniform(0.3, 1.0)),
+            "trackerID": idx + 1,
+            "boundingBox": {"left": float(lefts[idx]), "top": float(tops[idx]),
+                            "width": float(sizes[idx, 0]), "height": float(sizes[idx, 1])},
+        }
+        if vertices:
+            angles = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+            tilt = rng.uniform(0, np.pi)
+            rx, ry = sizes[idx] / 2
+            x = rx * np.cos(angles) * np.cos(tilt) - ry * np.sin(angles) * np.sin(tilt)
+            y = rx * np.cos(angles) * np.sin(tilt) + ry * np.sin(angles) * np.cos(tilt)
+            x += lefts[idx] + rx
+            y += tops[idx] + ry
+            detection["keyPoints"] = [{"cx": float(cx), "cy": float(cy)} for cx, cy in zip(x, y)]
+        detections.append(detection)
+    return detections
+
+
+def run_case(executor, frame_name, count, vertices, axis, iterations, warmup):
+    shape = FRAMES[frame_name]
+    detections = synthetic_detections(count, vertices, shape)
+    params = {
+        "ConfigColorAxis": axis,
+        "ConfigColorPalette": "tab20",
+        "ConfigPaletteSize": 20,
+        "ConfigThickness": 2,
+        "ConfigRadius": 0,
+    }
+    drawer = standins.component(executor, params, detections)
+    blank = np.zeros(shape, dtype=np.uint8)
+    frame = blank.copy()
+
+    def draw_frame():
+        drawer.load_detections()
+        drawer.draw_bounding_rectangle(frame, drawer.select_color())
+
+    for _ in range(warmup):
+        np.copyto(frame, blank)
+        draw_frame()
+
+    timings = np.empty(iterations)
+    for idx in range(iterations):
+        np.copyto(frame, blank)
+        start = time.perf_counter()
+        draw_frame()
+        timings[idx] = time.perf_counter() - start
+
+    # Traced separately, tracemalloc would distort the timings
+    np.copyto(frame, blank)
+    tracemalloc.start()
+    draw_frame()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "frame": frame_name,
+        "detections": count,
+        "vertices": vertices,
+        "axis": axis,
+        "p50_ms": float(np.percentile(timings, 50) * 1e3),
+        "p95_ms": float(np.percentile(timings, 95) * 1e3),
+        "p99_ms": float(np.percentile(timings, 99) * 1e3),
+        "fps": float(1.0 / timings.mean()),
+        "peak_mb": peak / 2 ** 20,
+    }
+
+
+def case_key(result):
+    return f"{result['frame']}/{result['detections']}/{result['vertices']}/{result['axis']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", nargs="+", choices=sorted(FRAMES), default=list(FRAMES))
+    parser.add_argument("--counts", nargs="+", type=int, default=list(COUNTS))
+    parser.add_argument("--vertices", nargs="+", type=int, default=list(VERTICES))
+    parser.add_argument("--axes", nargs="+", choices=AXES, default=list(AXES))
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--quick", action="store_true", help="1080p, 10/500 detections, 0/500 vertices, Class axis")
+    parser.add_argument("--save", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="compare p50 latency against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args()
+    if args.quick:
+        args.frames, args.counts, args.vertices, args.axes = ["1080p"], [10, 500], [0, 500], ["Class"]
+
+    executor = standins.install()
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = {case_key(result): result for result in json.load(handle)}
+
+    header = f"{'frame':<6}{'dets':>6}{'verts':>7} {'axis':<6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'fps':>9}{'peak MB':>9}"
+    print(header + ("    vs base" if baseline else ""))
+    results, regressions = [], []
+    for frame_name, count, vertices, axis in itertools.product(args.frames, args.counts, args.vertices, args.axes):
+        result = run_case(executor, frame_name, count, vertices, axis, args.iterations, args.warmup)
+        results.append(result)
+        line = (f"{frame_name:<6}{count:>6}{vertices:>7} {axis:<6}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+                f"{result['p99_ms']:>9.2f}{result['fps']:>9.1f}{result['peak_mb']:>9.2f}")
+        previous = baseline.get(case_key(result))
+        if previous:
+            change = (result["p50_ms"] / previous["p50_ms"] - 1) * 100
+            line += f"{change:>+10.1f}%"
+            if change > args.threshold:
+                regressions.append(case_key(result))
+                line += "  REGRESSION"
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump(results, handle, indent=2)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0f}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Equivalence check of the batched drawing engine against the per-detection path.
+
+Builds detections laid out on a grid so that no two boxes overlap, with a keyPoint
+polygon on most of them and a plain boundingBox on the rest, then checks that:
+
+- the batched corners equal geometry.reference_boxes, the per-polygon
+  cv2.minAreaRect/cv2.boxPoints path, exactly in float32 and after integer truncation;
+- the drawn frame equals, pixel for pixel, the frame drawn by the original
+  per-detection loop (cv2.drawContours / cv2.rectangle per box).
+
+Boxes are drawn grouped by color, so where boxes of different colors overlap the color
+on top can differ from the per-detection order. --overlapping reports that difference
+on a random layout instead of failing on it.
+
+    python benchmarks/equivalence.py [--cell 96] [--vertices 200] [--thickness 2] [--overlapping 300]
+
+Exits with status 1 when any check fails.
+"""
+import argparse
+import importlib
+import os
+import sys
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+def grid_detections(shape, cell, vertices, seed=0):
+    """
+    One detection per cell x cell block, kept inside its block with room for the line,
+    so no two drawn boxes touch. Every fourth detection is bbox-only.
+    """
+    rng = np.random.default_rng(seed)
+    height, width = shape[:2]
+    # A rectangle fitted to an ellipse stays within sqrt(2) of its longer radius
+    limit = (cell / 2 - 4) / np.sqrt(2)
+    detections = []
+    for top in range(0, height - cell + 1, cell):
+        for left in range(0, width - cell + 1, cell):
+            cx, cy = left + cell / 2, top + cell / 2
+            rx, ry = rng.uniform(limit / 4, limit, 2)
+            detection = {"classId": int(rng.integers(0, 80)), "trackerID": len(detections) + 1,
+                         "boundingBox": {"left": float(cx - rx), "top": float(cy - ry),
+                                         "width": float(2 * rx), "height": float(2 * ry)}}
+            if len(detections) % 4:
+                angles = np.linspace(0, 2 * np.pi, vertices, endpoint=False)
+                tilt = rng.uniform(0, np.pi)
+                x = cx + rx * np.cos(angles) * np.cos(tilt) - ry * np.sin(angles) * np.sin(tilt)
+                y = cy + rx * np.cos(angles) * np.sin(tilt) + ry * np.sin(angles) * np.cos(tilt)
+                detection["keyPoints"] = [{"cx": float(px), "cy": float(py)} for px, py in zip(x, y)]
+            detections.append(detection)
+    return detections
+
+
+def per_detection_draw(image, detections, color_dict, thickness):
+    """
+    The original drawing loop: one minAreaRect/boxPoints/drawContours or rectangle call
+    per detection, in input order, with colors taken by detection index.
+    """
+    for idx, detection in enumerate(detections):
+        key_points = detection.get("keyPoints")
+        bbox = detection.get("boundingBox")
+        color = color_dict[idx]
+        if key_points and len(key_points) >= 3:
+            points = np.array([[int(kp["cx"]), int(kp["cy"])] for kp in key_points], dtype=np.int32)
+            box = cv2.boxPoints(cv2.minAreaRect(points)).astype(np.int32)
+            cv2.drawContours(image, [box], 0, color, thickness)
+        elif bbox:
+            x1, y1 = int(bbox["left"]), int(bbox["top"])
+            x2, y2 = int(bbox["left"] + bbox["width"]), int(bbox["top"] + bbox["height"])
+            cv2.rectangle(image, (x1, y1), (x2, y2), color, thickness)
+    return image
+
+
+def compare(executor, detections, shape, thickness):
+    geometry = importlib.import_module("components.DrawBoundingRectangle.src.utils.geometry")
+    params = {"ConfigColorAxis": "Index", "ConfigColorPalette": "tab20", "ConfigPaletteSize": 20,
+              "ConfigThickness": thickness, "ConfigRadius": 0}
+    drawer = standins.component(executor, params, detections)
+    columns = drawer.columns
+
+    rotated = np.flatnonzero(columns.kp_counts >= 3)
+    batched = geometry.box_points(geometry.min_area_rects(columns.kp_offsets, columns.kp_points, rotated))
+    offsets, points = geometry.pack_polygons([columns.kp_points[columns.kp_offsets[i]:columns.kp_offsets[i + 1]]
+                                              for i in rotated])
+    reference = geometry.reference_boxes(offsets, points)
+    same_corners = np.array_equal(batched, reference)
+    same_int_corners = np.array_equal(batched.astype(np.int32), reference.astype(np.int32))
+
+    color_dict = drawer.select_color()
+    drawn = drawer.draw_bounding_rectangle(np.zeros(shape, dtype=np.uint8), color_dict)
+    expected = per_detection_draw(np.zeros(shape, dtype=np.uint8), detections, color_dict, thickness)
+    differing = int(np.count_nonzero((drawn != expected).any(axis=2)))
+    return same_corners, same_int_corners, differing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--cell", type=int, default=96, help="grid cell side in pixels")
+    parser.add_argument("--vertices", type=int, default=200)
+    parser.add_argument("--thickness", type=int, default=2)
+    parser.add_argument("--overlapping", type=int, default=0, metavar="N",
+                        help="also report the pixel difference for N randomly placed detections")
+    args = parser.parse_args()
+
+    executor = standins.install()
+    shape = FRAMES[args.frame]
+    detections = grid_detections(shape, args.cell, args.vertices)
+    same_corners, same_int_corners, differing = compare(executor, detections, shape, args.thickness)
+    print(f"{args.frame}, {len(detections)} non-overlapping detections, {args.vertices} vertices")
+    print(f"corners equal reference_boxes:      {same_corners}")
+    print(f"integer corners equal:              {same_int_corners}")
+    print(f"pixels differing from per-detection: {differing}")
+
+    if args.overlapping:
+        overlapping = synthetic_detections(args.overlapping, args.vertices, shape)
+        _, _, overlap_differing = compare(executor, overlapping, shape, args.thickness)
+        print(f"{args.overlapping} overlapping detections, pixels where another color is on top: {overlap_differing}")
+
+    if not (same_corners and same_int_corners and differing == 0):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
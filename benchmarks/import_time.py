@@ -0,0 +1,62 @@
+"""
+Import-time benchmark for palette loading.
+
+Compares, in fresh interpreters, the cold cost of the matplotlib.pyplot import the
+executor used to pay at startup against the embedded colormap table that replaces it.
+
+    python benchmarks/import_time.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../'))
+
+CASES = {
+    "matplotlib.pyplot": "import matplotlib.pyplot as plt; plt.get_cmap('tab20').colors",
+    "embedded table": (
+        "from components.DrawBoundingRectangle.src.utils.palette import compile_palette; "
+        "compile_palette('tab20', 20)"
+    ),
+}
+
+PROBE = """
+import resource, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(statement, runs):
+    timings, rss = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            cwd=ROOT, check=True, capture_output=True, text=True,
+        ).stdout.split()
+        timings.append(float(out[0]))
+        rss.append(int(out[1]))
+    return statistics.median(timings), max(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<20}{'median ms':>12}{'peak RSS MB':>14}")
+    for name, statement in CASES.items():
+        try:
+            seconds, rss_kb = measure(statement, args.runs)
+        except subprocess.CalledProcessError as exc:
+            print(f"{name:<20}{'failed':>12}  {exc.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{name:<20}{seconds * 1e3:>12.1f}{rss_kb / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
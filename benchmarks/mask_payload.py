@@ -0,0 +1,91 @@
+"""
+Payload size and parse cost of mask payloads against keyPoint polygons.
+
+Builds rotated elliptical masks, then sends each one to DetectionColumns as a dense
+keyPoints outline, an RLE mask and a bit-packed mask. Reports the JSON size, the
+time to parse the JSON and build the columns, and whether every encoding yields the
+same fitted rectangles.
+
+    python benchmarks/mask_payload.py [--detections 200] [--size 160] [--repeats 5]
+"""
+import argparse
+import base64
+import importlib
+import json
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+
+
+def synthetic_masks(count, size, seed=0):
+    rng = np.random.default_rng(seed)
+    masks = []
+    for _ in range(count):
+        mask = np.zeros((size, size), dtype=np.uint8)
+        axes = tuple(int(axis) for axis in rng.integers(size // 8, size // 2 - 2, 2))
+        cv2.ellipse(mask, (size // 2, size // 2), axes, float(rng.uniform(0, 180)), 0, 360, 1, -1)
+        masks.append((int(rng.integers(0, 1600)), int(rng.integers(0, 900)), mask))
+    return masks
+
+
+def encode(masks, encoding):
+    detections = []
+    for left, top, mask in masks:
+        detection = {"classId": 0, "trackerID": len(detections) + 1}
+        height, width = mask.shape
+        if encoding == "keyPoints":
+            contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+            detection["keyPoints"] = [{"cx": float(x + left), "cy": float(y + top)}
+                                      for x, y in np.concatenate(contours).reshape(-1, 2)]
+        elif encoding == "rle":
+            flat = mask.ravel()
+            edges = np.flatnonzero(np.diff(flat)) + 1
+            runs = np.diff(np.concatenate(([0], edges, [flat.size])))
+            counts = runs.tolist() if flat[0] == 0 else [0] + runs.tolist()
+            detection["mask"] = {"encoding": "rle", "left": left, "top": top, "width": width, "height": height,
+                                 "counts": counts}
+        else:
+            data = base64.b64encode(np.packbits(mask.ravel())).decode()
+            detection["mask"] = {"encoding": "bitpacked", "left": left, "top": top, "width": width, "height": height,
+                                 "data": data}
+        detections.append(detection)
+    return json.dumps(detections)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--detections", type=int, default=200)
+    parser.add_argument("--size", type=int, default=160, help="mask side in pixels")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    standins.install()
+    detections_module = importlib.import_module("components.DrawBoundingRectangle.src.utils.detections")
+    geometry = importlib.import_module("components.DrawBoundingRectangle.src.utils.geometry")
+    masks = synthetic_masks(args.detections, args.size)
+
+    print(f"{args.detections} masks of {args.size}x{args.size} px")
+    print(f"{'payload':<11}{'JSON KB':>10}{'parse ms':>10}  same rects")
+    reference = None
+    for encoding in ("keyPoints", "rle", "bitpacked"):
+        payload = encode(masks, encoding)
+        timings = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            columns = detections_module.DetectionColumns.from_detections(json.loads(payload))
+            timings.append(time.perf_counter() - start)
+        rects = geometry.min_area_rects(columns.kp_offsets, columns.kp_points)
+        reference = rects if reference is None else reference
+        print(f"{encoding:<11}{len(payload) / 1024:>10.1f}{min(timings) * 1e3:>10.2f}  {np.array_equal(rects, reference)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Per-frame allocation profile of the Standard and Lean memory modes.
+
+Parses and draws a stream of frames with tracemalloc running and reports, per frame
+after warm-up, the memory blocks and bytes a frame left changed on the heap and the
+traced peak, which covers every temporary array from parsing the detections to
+releasing their buffers. Each frame is also checked to have been drawn in place on the
+fetched buffer.
+
+    python benchmarks/memory_profile.py [--detections 500] [--vertices 200] [--frames 20] [--radius 0]
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+def profile(executor, mode, detections, shape, frames, warmup, radius):
+    params = {"ConfigColorAxis": "Track", "ConfigColorPalette": "tab20", "ConfigPaletteSize": 20,
+              "ConfigThickness": 2, "ConfigRadius": radius, "ConfigMemoryMode": mode}
+    drawer = standins.component(executor, params, detections)
+    frame = np.zeros(shape, dtype=np.uint8)
+    counts, sizes, peaks, in_place = [], [], [], True
+
+    for idx in range(warmup + frames):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        drawer.load_detections()
+        drawn = drawer.draw_bounding_rectangle(frame, drawer.select_color())
+        drawer.release_detections()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        in_place &= drawn is frame
+        if idx < warmup:
+            continue
+        stats = after.compare_to(before, "lineno")
+        counts.append(sum(abs(stat.count_diff) for stat in stats))
+        sizes.append(sum(stat.size_diff for stat in stats if stat.size_diff > 0))
+        peaks.append(peak)
+
+    return {
+        "mode": mode,
+        "blocks": float(np.mean(counts)),
+        "retained_kb": float(np.mean(sizes)) / 1024,
+        "peak_kb": float(np.max(peaks)) / 1024,
+        "in_place": in_place,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--detections", type=int, default=500)
+    parser.add_argument("--vertices", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--radius", type=int, default=0)
+    args = parser.parse_args()
+
+    executor = standins.install()
+    shape = FRAMES[args.frame]
+    detections = synthetic_detections(args.detections, args.vertices, shape)
+    print(f"{args.frame}, {args.detections} detections, {args.vertices} vertices, radius {args.radius}")
+    print(f"{'mode':<10}{'blocks/frame':>14}{'KB/frame':>11}{'peak KB':>10}  in place")
+    for mode in ("Standard", "Lean"):
+        result = profile(executor, mode, detections, shape, args.frames, args.warmup, args.radius)
+        print(f"{result['mode']:<10}{result['blocks']:>14.0f}{result['retained_kb']:>11.1f}"
+              f"{result['peak_kb']:>10.1f}  {result['in_place']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Serial vs sharded rotated-rectangle fitting on dense frames.
+
+Times min_area_rects against sharded_min_area_rects on the thread and process pools and
+checks that every backend returns the serial rows exactly. Scaling depends on the
+cores available; the pools are warmed up before timing.
+
+    python benchmarks/parallel_geometry.py [--counts 1000 5000] [--vertices 300] [--repeats 5]
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+
+def best_of(repeats, fn):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", nargs="+", type=int, default=[1000, 5000])
+    parser.add_argument("--vertices", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    standins.install()
+    geometry = importlib.import_module("components.DrawBoundingRectangle.src.utils.geometry")
+    sharding = importlib.import_module("components.DrawBoundingRectangle.src.utils.sharding")
+    detections_module = importlib.import_module("components.DrawBoundingRectangle.src.utils.detections")
+
+    print(f"{os.cpu_count()} cores, {args.vertices} vertices per polygon")
+    print(f"{'dets':>6}{'serial ms':>11}{'threads ms':>12}{'processes ms':>14}  exact")
+    for count in args.counts:
+        columns = detections_module.DetectionColumns.from_detections(
+            synthetic_detections(count, args.vertices, FRAMES["4K"]))
+        indices = np.flatnonzero(columns.kp_counts >= 3)
+        offsets, points = columns.kp_offsets, columns.kp_points
+        serial_time, serial = best_of(args.repeats, lambda: geometry.min_area_rects(offsets, points, indices))
+        line, exact = f"{count:>6}{serial_time * 1e3:>11.1f}", True
+        for processes, width in ((False, 12), (True, 14)):
+            sharding.sharded_min_area_rects(offsets, points, indices, processes=processes)
+            elapsed, rects = best_of(args.repeats, lambda: sharding.sharded_min_area_rects(
+                offsets, points, indices, processes=processes))
+            exact &= np.array_equal(rects, serial)
+            line += f"{elapsed * 1e3:>{width}.1f}"
+        print(f"{line}  {exact}")
+
+
+if __name__ == "__main__":
+    main()
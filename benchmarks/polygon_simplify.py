@@ -0,0 +1,80 @@
+"""
+Accuracy-vs-speed benchmark for the keyPoint polygon preprocessing of ConfigPolygonSimplify.
+
+Masks are rasterized blobs traced back with cv2.findContours, resampled to the vertex
+counts segmentation models emit, so vertex spacing and jaggedness match real masks.
+For each density and mode it reports the fitting time per polygon, the largest
+relative area change against the unprocessed rectangle and the median and 95th
+percentile corner deviation. The tail of the corner deviation comes from near-square
+masks whose fitted angle flips between almost equal rectangles.
+
+    python benchmarks/polygon_simplify.py [--masks 300] [--seed 0]
+"""
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
+
+from components.DrawBoundingRectangle.src.utils.geometry import pack_polygons, min_area_rects, box_points
+
+DENSITIES = (50, 200, 500, 1000, 2000)
+MODES = (
+    ("None", {}),
+    ("Simplify 0.5px", {"tolerance": 0.5}),
+    ("Simplify 1px", {"tolerance": 1.0}),
+    ("Simplify 3px", {"tolerance": 3.0}),
+    ("Decimate 256", {"max_vertices": 256}),
+    ("Decimate 128", {"max_vertices": 128}),
+    ("Decimate 64", {"max_vertices": 64}),
+)
+
+
+def synthetic_mask(rng, vertices):
+    """
+    Traces a random rotated, noisy ellipse mask and resamples its contour to the given vertex count.
+    """
+    size = int(max(64, vertices / 3))
+    canvas = np.zeros((2 * size, 2 * size), dtype=np.uint8)
+    axes = (int(rng.uniform(0.3, 0.9) * size), int(rng.uniform(0.2, 0.6) * size))
+    cv2.ellipse(canvas, (size, size), axes, rng.uniform(0, 180), 0, 360, 255, -1)
+    for _ in range(8):
+        center = tuple(int(c) for c in rng.uniform(0.3, 1.7, 2) * size)
+        cv2.circle(canvas, center, int(rng.uniform(0.05, 0.2) * size), int(rng.choice((0, 255))), -1)
+    contours, _ = cv2.findContours(canvas, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    contour = max(contours, key=len).reshape(-1, 2)
+    picks = np.linspace(0, len(contour), vertices, endpoint=False).astype(np.int64)
+    return contour[picks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--masks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'vertices':>9} {'mode':<16}{'us/polygon':>12}{'p50 px':>10}{'p95 px':>10}{'max area %':>12}")
+    for vertices in DENSITIES:
+        offsets, points = pack_polygons([synthetic_mask(rng, vertices) for _ in range(args.masks)])
+        reference = None
+        for name, options in MODES:
+            start = time.perf_counter()
+            rects = min_area_rects(offsets, points, **options)
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = rects
+            # Corner order depends on the fitted angle, compare each corner with its nearest reference corner
+            corners, expected = box_points(rects), box_points(reference)
+            distance = np.linalg.norm(corners[:, :, None] - expected[:, None], axis=-1).min(axis=2).max(axis=1)
+            area = np.abs(rects[:, 2] * rects[:, 3] / (reference[:, 2] * reference[:, 3]) - 1).max()
+            print(f"{vertices:>9} {name:<16}{elapsed / args.masks * 1e6:>12.1f}"
+                  f"{np.median(distance):>10.2f}{np.percentile(distance, 95):>10.2f}{area * 100:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
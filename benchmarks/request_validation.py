@@ -0,0 +1,96 @@
+"""
+Request validation cost of the Fast and Strict ConfigValidation modes.
+
+Builds a full DrawBoundingRectangle request around synthetic detections and times
+validate_request both ways: Strict validates every detection against the pydantic
+schema, Fast validates configs and the image, shape-checks the detections and keeps
+them raw. It also checks that DetectionColumns built from either model's detections
+are identical, and exits with status 1 when they are not.
+
+    python benchmarks/request_validation.py [--detections 500] [--vertices 300] [--iterations 5]
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import standins
+from draw_bounding_rectangle import FRAMES, synthetic_detections
+
+COLUMNS = ("class_ids", "tracker_ids", "confidences", "bboxes", "has_bbox", "kp_offsets", "kp_points", "obb", "has_obb")
+
+
+def option(name, value, **nested):
+    return dict({"name": name, "value": value, "type": "string", "field": "option"}, **nested)
+
+
+def build_request(detections):
+    configs = {
+        "configColorAxis": {"name": "ConfigColorAxis", "value": option("Track", "Track"), "type": "object",
+                            "field": "dropdownlist"},
+        "configColorPalette": {"name": "ConfigColorPalette", "type": "object", "field": "dependentDropdownlist",
+                               "value": option("ColorPaletteTab20", "tab20", configPaletteSize={
+                                   "name": "ConfigPaletteSize", "value": 20, "type": "number", "field": "textInput"})},
+        "configThickness": {"name": "ConfigThickness", "value": 2, "type": "number", "field": "textInput"},
+        "configRadius": {"name": "ConfigRadius", "value": 0, "type": "number", "field": "textInput"},
+    }
+    inputs = {
+        "inputImage": {"name": "inputImage", "value": {"uID": "frame", "name": "frame"}, "type": "object"},
+        "inputDetections": {"name": "inputDetections", "value": detections, "type": "list"},
+    }
+    executor = {"name": "DrawBoundingRectangle", "type": "object", "field": "option",
+                "value": {"inputs": inputs, "configs": configs}}
+    return {"name": "DrawBoundingRectangle", "type": "component",
+            "configs": {"executor": {"name": "ConfigExecutor", "type": "executor", "field": "dependentDropdownlist",
+                                     "restart": True, "value": executor}}}
+
+
+def validation_time(validate_request, data, strict, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        model = validate_request(data, strict=strict)
+        timings.append(time.perf_counter() - start)
+    return min(timings), model.configs.executor.value.value.inputs.inputDetections.value
+
+
+def same_columns(first, second):
+    return first.class_labels == second.class_labels and all(
+        np.array_equal(getattr(first, name), getattr(second, name), equal_nan=getattr(first, name).dtype.kind == "f")
+        for name in COLUMNS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame", choices=sorted(FRAMES), default="1080p")
+    parser.add_argument("--detections", type=int, default=500)
+    parser.add_argument("--vertices", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    standins.install()
+    validation = importlib.import_module("components.DrawBoundingRectangle.src.utils.validation")
+    detections_module = importlib.import_module("components.DrawBoundingRectangle.src.utils.detections")
+    data = build_request(synthetic_detections(args.detections, args.vertices, FRAMES[args.frame]))
+
+    strict_time, strict_detections = validation_time(validation.validate_request, data, True, args.iterations)
+    fast_time, fast_detections = validation_time(validation.validate_request, data, False, args.iterations)
+    columns = detections_module.DetectionColumns.from_detections
+    identical = same_columns(columns(strict_detections), columns(fast_detections))
+
+    print(f"{args.detections} detections, {args.vertices} vertices")
+    print(f"strict {strict_time * 1e3:>9.2f} ms")
+    print(f"fast   {fast_time * 1e3:>9.2f} ms")
+    print(f"identical detection columns: {identical}")
+    if not identical:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Local stand-ins for the parts of the NovaVision SDK the component touches, so the
+benchmarks run without the SDK or a Redis server.
+
+When the real SDK is importable it is used for everything but frame transport; the
+executor's Image helper is always swapped for InMemoryImage.
+"""
+import importlib
+import sys
+import types
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class InMemoryImage:
+    """
+    Image.get_frame/Image.set_frame replacement backed by a dict instead of Redis.
+    """
+    frames = {}
+
+    @classmethod
+    def put(cls, uid, value):
+        cls.frames[uid] = value
+
+    @classmethod
+    def get_frame(cls, img, redis_db=None):
+        frame = img.model_copy() if hasattr(img, "model_copy") else img.copy()
+        frame.value = cls.frames[img.uID]
+        return frame
+
+    @classmethod
+    def set_frame(cls, img, package_uID=None, redis_db=None):
+        cls.frames[img.uID] = img.value
+        return img
+
+
+class StandInRequest:
+    """
+    Minimal request exposing get_param over a flat {name: value} mapping.
+    """
+    def __init__(self, params):
+        self.params = params
+        self.data = {}
+
+    def get_param(self, name):
+        return self.params.get(name)
+
+
+def _sdk_modules():
+    class Config(BaseModel):
+        pass
+
+    class Image(BaseModel):
+        uID: Optional[str] = None
+        name: Optional[str] = None
+        value: Any = None
+
+    class BoundingBox(BaseModel):
+        left: float
+        top: float
+        width: float
+        height: float
+
+    class KeyPoints(BaseModel):
+        cx: float
+        cy: float
+
+    class Detection(BaseModel):
+        boundingBox: Optional[BoundingBox] = None
+        classLabel: Optional[str] = None
+        classId: Optional[int] = None
+        confidence: Optional[float] = None
+        trackerID: Optional[int] = None
+
+    class ROI(BaseModel):
+        boundingBox: Optional[BoundingBox] = None
+
+    class Component:
+        def __init__(self, request, bootstrap):
+            self.request = request
+            self.bootstrap = bootstrap
+            self.redis_db = None
+            self.uID = "benchmark"
+
+    class Executor:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("The stand-in SDK cannot execute packages.")
+
+    class PackageHelper:
+        def __init__(self, packageModel, packageConfigs):
+            self.packageConfigs = packageConfigs
+
+        def build_model(self, context):
+            return self.packageConfigs
+
+    model = {name: type(name, (BaseModel,), {}) for name in
+             ("Package", "Inputs", "Configs", "Outputs", "Response", "Request", "Output", "Input")}
+    model.update(Config=Config, Image=Image, BoundingBox=BoundingBox, KeyPoints=KeyPoints, Detection=Detection, ROI=ROI)
+    return {
+        "sdks.novavision.src.base.model": model,
+        "sdks.novavision.src.base.component": {"Component": Component},
+        "sdks.novavision.src.media.image": {"Image": InMemoryImage},
+        "sdks.novavision.src.helper.executor": {"Executor": Executor},
+        "sdks.novavision.src.helper.package": {"PackageHelper": PackageHelper},
+    }
+
+
+def install():
+    """
+    Imports the executor module, registering stand-in SDK modules first if the SDK is
+    missing, and points its frame transport at InMemoryImage.
+    """
+    try:
+        importlib.import_module("sdks.novavision.src.base.component")
+    except ImportError:
+        for name, attributes in _sdk_modules().items():
+            parts = name.split(".")
+            for depth in range(1, len(parts)):
+                sys.modules.setdefault(".".join(parts[:depth]), types.ModuleType(".".join(parts[:depth])))
+            module = types.ModuleType(name)
+            module.__dict__.update(attributes)
+            sys.modules[name] = module
+    executor = importlib.import_module("components.DrawBoundingRectangle.src.executors.DrawBoundingRectangle")
+    executor.Image = InMemoryImage
+    return executor
+
+
+def component(executor, params, detections, image=None, bootstrap=None):
+    """
+    Builds a DrawBoundingRectangle without PackageModel parsing, as a warm worker would hold it.
+    """
+    cls = executor.DrawBoundingRectangle
+    drawer = cls.__new__(cls)
+    drawer.request = StandInRequest(params)
+    drawer.bootstrap = bootstrap if bootstrap is not None else cls.bootstrap({})
+    drawer.redis_db = None
+    drawer.uID = "benchmark"
+    drawer.image = image
+    drawer.detections = detections
+    drawer.color_axis = params.get("ConfigColorAxis", "Class")
+    drawer.load_parameters()
+    drawer.load_detections()
+    drawer.load_colors()
+    return drawer
@@ -1,7 +1,9 @@
 
-from pydantic import Field, validator
+import re
+from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Union, Literal
 from sdks.novavision.src.base.model import Package, Image, Inputs, Configs, Outputs, Response, Request, Output, Input, Config, Detection, ROI, KeyPoints
+from components.DrawBoundingRectangle.src.utils.masks import require_mask_fields
 
 class ConfigCustomColors(Config):
     """
@@ -311,6 +313,816 @@ class ConfigThickness(Config):
         }
 
 
+class ConfigColorMapCapacity(Config):
+    """
+    Maximum number of class or track IDs that keep a color assignment.
+    The least recently seen IDs are evicted first and their colors are reused.
+    """
+    name: Literal["ConfigColorMapCapacity"] = "ConfigColorMapCapacity"
+    value: int = Field(default=1000, ge=1, le=100000)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Color Map Capacity"
+        json_schema_extra = {
+            "shortDescription": "Max Remembered IDs"
+        }
+
+
+class ConfigColorMapTTL(Config):
+    """
+    Seconds after which an ID that was not seen again loses its color assignment.
+    Use 0 to keep assignments until capacity eviction.
+    """
+    name: Literal["ConfigColorMapTTL"] = "ConfigColorMapTTL"
+    value: float = Field(default=0, ge=0)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Color Map TTL"
+        json_schema_extra = {
+            "shortDescription": "ID Color Expiry (s)"
+        }
+
+
+class ConfigOpacity(Config):
+    """
+    Opacity of the boxes composited in overlay mode, from 0 (invisible) to 1 (opaque).
+    """
+    name: Literal["ConfigOpacity"] = "ConfigOpacity"
+    value: float = Field(default=1.0, ge=0, le=1)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Opacity"
+        json_schema_extra = {
+            "shortDescription": "Box Opacity"
+        }
+
+
+class RenderModeDirect(Config):
+    name: Literal["Direct"] = "Direct"
+    value: Literal["Direct"] = "Direct"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Direct"
+
+
+class RenderModeOverlay(Config):
+    name: Literal["Overlay"] = "Overlay"
+    configOpacity: ConfigOpacity
+    value: Literal["Overlay"] = "Overlay"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Overlay"
+
+
+class ConfigRenderMode(Config):
+    """
+    Determines how boxes are rendered onto the frame.
+    'Direct' draws on the frame, 'Overlay' draws once per color onto a reusable
+    overlay and blends it onto the frame, which allows semi-transparent boxes.
+    Both modes draw boxes grouped by color: where boxes of different colors overlap, the
+    color drawn last is the one whose first box comes last, not the last detection.
+    """
+    name: Literal["ConfigRenderMode"] = "ConfigRenderMode"
+    value: Union[RenderModeDirect, RenderModeOverlay]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Render Mode"
+        json_schema_extra = {
+            "shortDescription": "Box Rendering Mode"
+        }
+
+
+class IncrementalDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class IncrementalEnabled(Config):
+    name: Literal["Enabled"] = "Enabled"
+    value: Literal["Enabled"] = "Enabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Enabled"
+
+
+class ConfigIncremental(Config):
+    """
+    Caches rotated rectangles per tracker ID and reuses them while the keyPoints are
+    unchanged. Regions that changed since the previous frame are reported in outputDirtyRegions.
+    """
+    name: Literal["ConfigIncremental"] = "ConfigIncremental"
+    value: Union[IncrementalDisabled, IncrementalEnabled]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Incremental Redraw"
+        json_schema_extra = {
+            "shortDescription": "Reuse Unchanged Geometry"
+        }
+
+
+class ConfigSimplifyTolerance(Config):
+    """
+    Maximum distance in pixels between a keyPoint polygon and its simplified version.
+    """
+    name: Literal["ConfigSimplifyTolerance"] = "ConfigSimplifyTolerance"
+    value: float = Field(default=1.0, gt=0, le=20)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Simplify Tolerance"
+        json_schema_extra = {
+            "shortDescription": "Simplify Tolerance (px)"
+        }
+
+
+class ConfigMaxVertices(Config):
+    """
+    Maximum number of keyPoint vertices kept per polygon; denser polygons are evenly decimated.
+    """
+    name: Literal["ConfigMaxVertices"] = "ConfigMaxVertices"
+    value: int = Field(default=256, ge=8, le=10000)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Max Vertices"
+        json_schema_extra = {
+            "shortDescription": "Max Polygon Vertices"
+        }
+
+
+class PolygonSimplifyNone(Config):
+    name: Literal["None"] = "None"
+    value: Literal["None"] = "None"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "None"
+
+
+class PolygonSimplifySimplify(Config):
+    name: Literal["Simplify"] = "Simplify"
+    configSimplifyTolerance: ConfigSimplifyTolerance
+    value: Literal["Simplify"] = "Simplify"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Douglas-Peucker"
+
+
+class PolygonSimplifyDecimate(Config):
+    name: Literal["Decimate"] = "Decimate"
+    configMaxVertices: ConfigMaxVertices
+    value: Literal["Decimate"] = "Decimate"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Decimate"
+
+
+class ConfigPolygonSimplify(Config):
+    """
+    Reduces dense keyPoint polygons before fitting the rotated rectangle.
+    'Simplify' applies Douglas-Peucker within a pixel tolerance, 'Decimate' keeps an
+    evenly strided subset of vertices. Both trade a little rectangle accuracy for speed on large masks.
+    """
+    name: Literal["ConfigPolygonSimplify"] = "ConfigPolygonSimplify"
+    value: Union[PolygonSimplifyNone, PolygonSimplifySimplify, PolygonSimplifyDecimate]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Polygon Simplification"
+        json_schema_extra = {
+            "shortDescription": "Mask Polygon Preprocessing"
+        }
+
+
+class MetricsDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class MetricsEnabled(Config):
+    name: Literal["Enabled"] = "Enabled"
+    value: Literal["Enabled"] = "Enabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Enabled"
+
+
+class ConfigMetrics(Config):
+    """
+    Records per-stage wall and CPU time plus detection, vertex and box counts,
+    reported in outputMetrics.
+    """
+    name: Literal["ConfigMetrics"] = "ConfigMetrics"
+    value: Union[MetricsDisabled, MetricsEnabled]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Metrics"
+        json_schema_extra = {
+            "shortDescription": "Stage Timing Metrics"
+        }
+
+
+class TransportRedis(Config):
+    name: Literal["Redis"] = "Redis"
+    value: Literal["Redis"] = "Redis"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Redis"
+
+
+class TransportSharedMemory(Config):
+    name: Literal["SharedMemory"] = "SharedMemory"
+    value: Literal["SharedMemory"] = "SharedMemory"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Shared Memory"
+
+
+class ConfigTransport(Config):
+    """
+    Determines how frames reach the component.
+    'Redis' fetches and stores full frames, 'SharedMemory' draws in place on frames
+    referenced by inputFrameHandle, for components running on the same host.
+    """
+    name: Literal["ConfigTransport"] = "ConfigTransport"
+    value: Union[TransportRedis, TransportSharedMemory]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Frame Transport"
+        json_schema_extra = {
+            "shortDescription": "Frame Transport"
+        }
+
+
+class ConfigParallelThreshold(Config):
+    """
+    Minimum number of keyPoint detections in a frame before rectangle fitting is sharded;
+    smaller frames are processed serially.
+    """
+    name: Literal["ConfigParallelThreshold"] = "ConfigParallelThreshold"
+    value: int = Field(default=1000, ge=1, le=1000000)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Parallel Threshold"
+        json_schema_extra = {
+            "shortDescription": "Min Detections to Shard"
+        }
+
+
+class ParallelSerial(Config):
+    name: Literal["Serial"] = "Serial"
+    value: Literal["Serial"] = "Serial"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Serial"
+
+
+class ParallelThreads(Config):
+    name: Literal["Threads"] = "Threads"
+    configParallelThreshold: ConfigParallelThreshold
+    value: Literal["Threads"] = "Threads"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Threads"
+
+
+class ParallelProcesses(Config):
+    name: Literal["Processes"] = "Processes"
+    configParallelThreshold: ConfigParallelThreshold
+    value: Literal["Processes"] = "Processes"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Processes"
+
+
+class ConfigParallelGeometry(Config):
+    """
+    Shards rotated-rectangle fitting of large frames across a pool, one contiguous chunk
+    of detections per core. 'Threads' shares the keyPoints directly, 'Processes' passes
+    them to the workers through shared memory. Boxes are drawn in the serial order.
+    """
+    name: Literal["ConfigParallelGeometry"] = "ConfigParallelGeometry"
+    value: Union[ParallelSerial, ParallelThreads, ParallelProcesses]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Parallel Geometry"
+        json_schema_extra = {
+            "shortDescription": "Shard Rectangle Fitting"
+        }
+
+
+class ValidationFast(Config):
+    name: Literal["Fast"] = "Fast"
+    value: Literal["Fast"] = "Fast"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Fast"
+
+
+class ValidationStrict(Config):
+    name: Literal["Strict"] = "Strict"
+    value: Literal["Strict"] = "Strict"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Strict"
+
+
+class ConfigValidation(Config):
+    """
+    Fast validates the configs and the image strictly but only checks the detections'
+    shape, leaving field parsing to the columnar reader. Strict validates every detection
+    and keyPoint against the schema, for debugging malformed upstream output.
+    """
+    name: Literal["ConfigValidation"] = "ConfigValidation"
+    value: Union[ValidationFast, ValidationStrict]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Request Validation"
+        json_schema_extra = {
+            "shortDescription": "Detection Schema Checks"
+        }
+
+
+class OutputDetectionsDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class OutputDetectionsEnabled(Config):
+    name: Literal["Enabled"] = "Enabled"
+    value: Literal["Enabled"] = "Enabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Enabled"
+
+
+class ConfigOutputDetections(Config):
+    """
+    Returns the detections with the oriented box computed for each of them in
+    outputDetections, so downstream components can reuse it instead of refitting.
+    """
+    name: Literal["ConfigOutputDetections"] = "ConfigOutputDetections"
+    value: Union[OutputDetectionsDisabled, OutputDetectionsEnabled]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Output Detections"
+        json_schema_extra = {
+            "shortDescription": "Emit Oriented Boxes"
+        }
+
+
+class MemoryModeStandard(Config):
+    name: Literal["Standard"] = "Standard"
+    value: Literal["Standard"] = "Standard"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Standard"
+
+
+class MemoryModeLean(Config):
+    name: Literal["Lean"] = "Lean"
+    value: Literal["Lean"] = "Lean"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Lean"
+
+
+class ConfigMemoryMode(Config):
+    """
+    'Lean' parses keyPoints straight into pooled buffers and computes rectangles,
+    corners and polygons in per-thread scratch arrays, all reused across frames, so
+    steady-state frames allocate almost nothing. Frames are drawn in place in either mode.
+    """
+    name: Literal["ConfigMemoryMode"] = "ConfigMemoryMode"
+    value: Union[MemoryModeStandard, MemoryModeLean]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Memory Mode"
+        json_schema_extra = {
+            "shortDescription": "Reuse Work Arrays"
+        }
+
+
+class ConfigRenderCacheSize(Config):
+    """
+    Maximum number of finished renders kept; the least recently used are evicted first.
+    """
+    name: Literal["ConfigRenderCacheSize"] = "ConfigRenderCacheSize"
+    value: int = Field(default=256, ge=1, le=100000)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Render Cache Size"
+        json_schema_extra = {
+            "shortDescription": "Max Cached Renders"
+        }
+
+
+class ConfigRenderCacheTTL(Config):
+    """
+    Seconds a finished render is reused for. Keep it below the lifetime of stored frames; 0 never expires.
+    """
+    name: Literal["ConfigRenderCacheTTL"] = "ConfigRenderCacheTTL"
+    value: float = Field(default=60, ge=0)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Render Cache TTL"
+        json_schema_extra = {
+            "shortDescription": "Cached Render Expiry (s)"
+        }
+
+
+class RenderCacheDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class RenderCacheEnabled(Config):
+    name: Literal["Enabled"] = "Enabled"
+    configRenderCacheSize: ConfigRenderCacheSize
+    configRenderCacheTTL: ConfigRenderCacheTTL
+    value: Literal["Enabled"] = "Enabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Enabled"
+
+
+class ConfigRenderCache(Config):
+    """
+    Answers a repeated single-frame request (same frame uID, detections and drawing
+    settings) with the output image stored the first time, skipping the draw and the
+    frame write. Incremental requests are always drawn, as their dirty regions depend
+    on the frame drawn before them.
+    """
+    name: Literal["ConfigRenderCache"] = "ConfigRenderCache"
+    value: Union[RenderCacheDisabled, RenderCacheEnabled]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Render Cache"
+        json_schema_extra = {
+            "shortDescription": "Reuse Repeated Renders"
+        }
+
+
+class ConfigLabelScale(Config):
+    """
+    Font scale of the label text drawn above each box.
+    """
+    name: Literal["ConfigLabelScale"] = "ConfigLabelScale"
+    value: float = Field(default=0.5, gt=0, le=4)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Label Scale"
+        json_schema_extra = {
+            "shortDescription": "Label Font Scale"
+        }
+
+
+class LabelsNone(Config):
+    name: Literal["None"] = "None"
+    value: Literal["None"] = "None"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "None"
+
+
+class LabelsClass(Config):
+    name: Literal["Class"] = "Class"
+    configLabelScale: ConfigLabelScale
+    value: Literal["Class"] = "Class"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Class"
+
+
+class LabelsClassConfidence(Config):
+    name: Literal["ClassConfidence"] = "ClassConfidence"
+    configLabelScale: ConfigLabelScale
+    value: Literal["ClassConfidence"] = "ClassConfidence"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Class and Confidence"
+
+
+class LabelsTrack(Config):
+    name: Literal["Track"] = "Track"
+    configLabelScale: ConfigLabelScale
+    value: Literal["Track"] = "Track"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Track ID and Class"
+
+
+class ConfigLabels(Config):
+    """
+    Draws a filled label on the top edge of every box: the class label, optionally with
+    the confidence or prefixed by the tracker ID. Glyphs are rasterized once per font size.
+    """
+    name: Literal["ConfigLabels"] = "ConfigLabels"
+    value: Union[LabelsNone, LabelsClass, LabelsClassConfidence, LabelsTrack]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Labels"
+        json_schema_extra = {
+            "shortDescription": "Box Label Text"
+        }
+
+
+class ConfigOutputWidth(Config):
+    """
+    Width in pixels of the stored output frame; the height follows the frame's aspect ratio.
+    Frames already at most this wide are drawn at native resolution.
+    """
+    name: Literal["ConfigOutputWidth"] = "ConfigOutputWidth"
+    value: int = Field(default=640, ge=16, le=7680)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Output Width"
+        json_schema_extra = {
+            "shortDescription": "Output Frame Width"
+        }
+
+
+class OutputResolutionNative(Config):
+    name: Literal["Native"] = "Native"
+    value: Literal["Native"] = "Native"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Native"
+
+
+class OutputResolutionScaled(Config):
+    name: Literal["Scaled"] = "Scaled"
+    configOutputWidth: ConfigOutputWidth
+    value: Literal["Scaled"] = "Scaled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Scaled"
+
+
+class ConfigOutputResolution(Config):
+    """
+    'Scaled' resizes the frame once with INTER_AREA and draws the scaled geometry on the
+    smaller frame, with line thickness and corner radius scaled alike, so drawing and
+    storing cost follow the display size. Shared-memory frames always stay native.
+    """
+    name: Literal["ConfigOutputResolution"] = "ConfigOutputResolution"
+    value: Union[OutputResolutionNative, OutputResolutionScaled]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Output Resolution"
+        json_schema_extra = {
+            "shortDescription": "Stored Frame Size"
+        }
+
+
+class CullingDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class CullingEnabled(Config):
+    name: Literal["Enabled"] = "Enabled"
+    value: Literal["Enabled"] = "Enabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Enabled"
+
+
+class ConfigCulling(Config):
+    """
+    Skips detections lying entirely outside the frame, clips partially visible upright
+    boxes to it and draws boxes smaller than the line thickness as a point marker.
+    Culled detections get no oriented box in outputDetections.
+    """
+    name: Literal["ConfigCulling"] = "ConfigCulling"
+    value: Union[CullingDisabled, CullingEnabled]
+    type: Literal["object"] = "object"
+    field: Literal["dropdownlist"] = "dropdownlist"
+
+    class Config:
+        title = "Culling"
+        json_schema_extra = {
+            "shortDescription": "Skip Off-Frame Boxes"
+        }
+
+
+class ConfigDensityThreshold(Config):
+    """
+    Detection count per frame from which the heatmap replaces the boxes.
+    """
+    name: Literal["ConfigDensityThreshold"] = "ConfigDensityThreshold"
+    value: int = Field(default=1000, ge=1, le=1000000)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Density Threshold"
+        json_schema_extra = {
+            "shortDescription": "Heatmap Above Detections"
+        }
+
+
+class ConfigDensityCell(Config):
+    """
+    Side in pixels of the square cells the detection centers are counted in.
+    """
+    name: Literal["ConfigDensityCell"] = "ConfigDensityCell"
+    value: int = Field(default=16, ge=2, le=256)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Density Cell"
+        json_schema_extra = {
+            "shortDescription": "Heatmap Cell Size (px)"
+        }
+
+
+class ConfigDensityOpacity(Config):
+    """
+    Opacity of the heatmap blended onto the frame, from 0 (invisible) to 1 (opaque).
+    """
+    name: Literal["ConfigDensityOpacity"] = "ConfigDensityOpacity"
+    value: float = Field(default=0.6, ge=0, le=1)
+    type: Literal["number"] = "number"
+    field: Literal["textInput"] = "textInput"
+
+    class Config:
+        title = "Density Opacity"
+        json_schema_extra = {
+            "shortDescription": "Heatmap Opacity"
+        }
+
+
+class DensityDisabled(Config):
+    name: Literal["Disabled"] = "Disabled"
+    value: Literal["Disabled"] = "Disabled"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Disabled"
+
+
+class DensityAuto(Config):
+    name: Literal["Auto"] = "Auto"
+    configDensityThreshold: ConfigDensityThreshold
+    configDensityCell: ConfigDensityCell
+    configDensityOpacity: ConfigDensityOpacity
+    value: Literal["Auto"] = "Auto"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Auto"
+
+
+class DensityAlways(Config):
+    name: Literal["Always"] = "Always"
+    configDensityCell: ConfigDensityCell
+    configDensityOpacity: ConfigDensityOpacity
+    value: Literal["Always"] = "Always"
+    type: Literal["string"] = "string"
+    field: Literal["option"] = "option"
+
+    class Config:
+        title = "Always"
+
+
+class ConfigDensity(Config):
+    """
+    Renders crowded frames as a density heatmap instead of individual boxes.
+    Detection centers are counted per grid cell, colorized along the selected color
+    palette and blended onto the frame; 'Auto' switches to it from a detection count.
+    Heatmap frames draw no labels and add no oriented boxes to outputDetections.
+    """
+    name: Literal["ConfigDensity"] = "ConfigDensity"
+    value: Union[DensityDisabled, DensityAuto, DensityAlways]
+    type: Literal["object"] = "object"
+    field: Literal["dependentDropdownlist"] = "dependentDropdownlist"
+
+    class Config:
+        title = "Density Heatmap"
+        json_schema_extra = {
+            "shortDescription": "Heatmap For Crowded Frames"
+        }
+
+
 class DrawBoundingRectangleConfigs(Configs):
     """
     Aggregates all visualization settings for drawing bounding rectangles.
@@ -320,6 +1132,22 @@ class DrawBoundingRectangleConfigs(Configs):
     configColorPalette: ConfigColorPalette
     configThickness: ConfigThickness
     configRadius: ConfigRadius
+    configColorMapCapacity: Optional[ConfigColorMapCapacity] = None
+    configColorMapTTL: Optional[ConfigColorMapTTL] = None
+    configRenderMode: Optional[ConfigRenderMode] = None
+    configIncremental: Optional[ConfigIncremental] = None
+    configPolygonSimplify: Optional[ConfigPolygonSimplify] = None
+    configMetrics: Optional[ConfigMetrics] = None
+    configTransport: Optional[ConfigTransport] = None
+    configValidation: Optional[ConfigValidation] = None
+    configParallelGeometry: Optional[ConfigParallelGeometry] = None
+    configOutputDetections: Optional[ConfigOutputDetections] = None
+    configMemoryMode: Optional[ConfigMemoryMode] = None
+    configRenderCache: Optional[ConfigRenderCache] = None
+    configLabels: Optional[ConfigLabels] = None
+    configOutputResolution: Optional[ConfigOutputResolution] = None
+    configCulling: Optional[ConfigCulling] = None
+    configDensity: Optional[ConfigDensity] = None
 
     class Config:
         title = "Draw Bounding Box Configurations"
@@ -327,18 +1155,62 @@ class DrawBoundingRectangleConfigs(Configs):
             "shortDescription": "Bounding Box Visual Settings"
         }
 
+class RotatedBox(BaseModel):
+    """
+    Oriented box as cv2.minAreaRect describes it: center, size and angle in degrees,
+    with its four corners in cv2.boxPoints order, for upright boxes (angle 0) as well.
+    """
+    cx: float
+    cy: float
+    width: float
+    height: float
+    angle: float
+    corners: Optional[List[KeyPoints]] = None
+
+
+class MaskPayload(BaseModel):
+    """
+    Compact segmentation mask covering the region at (left, top) of the frame.
+    'rle' counts alternate 0/1 runs in row-major order starting with 0, 'bitpacked'
+    is base64 of the row-major mask packed 8 pixels per byte, and 'shared' references
+    a mask tensor in shared memory through a frame handle.
+    """
+    encoding: Literal["rle", "bitpacked", "shared"]
+    left: int = 0
+    top: int = 0
+    width: Optional[int] = None
+    height: Optional[int] = None
+    counts: Optional[List[int]] = None
+    data: Optional[str] = None
+    handle: Optional[dict] = None
+
+    @validator("handle", always=True)
+    def require_encoding_fields(cls, value, values):
+        require_mask_fields(values.get("encoding"), {**values, "handle": value})
+        return value
+
+
 class Detection(Detection):
     """
     Extends the base Detection to ensure we accept the keyPoints
     generated by the YOLO Segmentation model.
     """
     keyPoints: Optional[List[KeyPoints]] = None
-    # We also accept 'angle' if OBB mode was used, though unlikely for segmentation
+    # We also accept 'angle' if OBB mode was used, though unlikely for segmentation.
+    # Without a rotatedBox, the boundingBox is then rotated by it around its center.
     angle: Optional[float] = None
+    # Precomputed oriented box; when present it is drawn as is, without minAreaRect
+    rotatedBox: Optional[RotatedBox] = None
+    # Mask payload, fitted through its contours when no keyPoints are given
+    mask: Optional[MaskPayload] = None
 
 class InputDetections(Input):
+    """
+    Detections to draw. With a list of input images, either one detection list per
+    frame or a single list applied to every frame.
+    """
     name: Literal["inputDetections"] = "inputDetections"
-    value: Union[List[Detection], List[ROI]]
+    value: Union[List[Detection], List[ROI], List[List[Detection]], List[List[ROI]]]
     type: str = "list"
 
     class Config:
@@ -378,17 +1250,84 @@ class OutputImage(Output):
         title = "Image"
 
 
+class InputFrameHandle(Input):
+    """
+    Shared-memory frame handle(s): ring name, slot, slot count, frame shape and dtype.
+    """
+    name: Literal["inputFrameHandle"] = "inputFrameHandle"
+    value: Union[dict, List[dict]]
+    type: str = "object"
+
+    class Config:
+        title = "Frame Handle"
+
+
 class DrawBoundingRectangleInputs(Inputs):
     inputImage: InputImage
     inputDetections: InputDetections
+    inputFrameHandle: Optional[InputFrameHandle] = None
 
     class Config:
         title = "Draw Bounding Rectangle Inputs"
 
 
 
+class OutputDirtyRegions(Output):
+    """
+    Regions, as [left, top, width, height], that differ from the previous frame.
+    One list per frame when a list of images is drawn.
+    """
+    name: Literal["outputDirtyRegions"] = "outputDirtyRegions"
+    value: Union[List[List[int]], List[List[List[int]]]]
+    type: str = "list"
+
+    class Config:
+        title = "Dirty Regions"
+
+
+class OutputMetrics(Output):
+    """
+    Per-stage wall and CPU milliseconds and counters of this request.
+    """
+    name: Literal["outputMetrics"] = "outputMetrics"
+    value: dict
+    type: str = "object"
+
+    class Config:
+        title = "Metrics"
+
+
+class OutputFrameHandle(Output):
+    """
+    Handle(s) of the shared-memory frames drawn in place.
+    """
+    name: Literal["outputFrameHandle"] = "outputFrameHandle"
+    value: Union[dict, List[dict]]
+    type: str = "object"
+
+    class Config:
+        title = "Frame Handle"
+
+
+class OutputDetections(Output):
+    """
+    The input detections with the angle and rotatedBox of every drawn box filled in.
+    One list per frame when a list of images is drawn.
+    """
+    name: Literal["outputDetections"] = "outputDetections"
+    value: Union[List[Detection], List[List[Detection]]]
+    type: str = "list"
+
+    class Config:
+        title = "Oriented Detections"
+
+
 class DrawBoundingRectangleOutputs(Outputs):
     outputImage: OutputImage
+    outputDirtyRegions: Optional[OutputDirtyRegions] = None
+    outputMetrics: Optional[OutputMetrics] = None
+    outputFrameHandle: Optional[OutputFrameHandle] = None
+    outputDetections: Optional[OutputDetections] = None
 
     class Config:
         title = "Draw Bounding Box Outputs"
@@ -0,0 +1,48 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+_frame_pool = None
+
+
+def frame_pool():
+    """
+    Process-wide thread pool shared by every multi-frame request, created on first use.
+    """
+    global _frame_pool
+    if _frame_pool is None:
+        _frame_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) + 4),
+            thread_name_prefix="DrawBoundingRectangle",
+        )
+    return _frame_pool
+
+
+_shard_threads = None
+_shard_processes = None
+
+
+def shard_pool(processes=False):
+    """
+    Pool for sharded geometry, created on first use. It is separate from frame_pool, whose
+    threads may be the ones waiting on the shards.
+    """
+    global _shard_threads, _shard_processes
+    if processes:
+        if _shard_processes is None:
+            # Workers attach to shared memory and must report to this process's resource
+            # tracker, so it has to be running before they start
+            resource_tracker.ensure_running()
+            # Forking this process would copy it mid-flight, with frame-pool and OpenCV
+            # threads running, which can deadlock the children; start them clean instead
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _shard_processes = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                   mp_context=multiprocessing.get_context(method))
+        return _shard_processes
+    if _shard_threads is None:
+        _shard_threads = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="DrawBoundingRectangleShard",
+        )
+    return _shard_threads
@@ -0,0 +1,99 @@
+import time
+from collections import OrderedDict
+
+
+class ColorAssigner:
+    """
+    Bounded key -> palette color assignment for Class and Track coloring.
+
+    Keys are kept in least-recently-seen order. A key that is seen every frame keeps
+    its color; keys unseen for longer than ttl seconds, or the least recently seen
+    ones once capacity is reached, are evicted and their colors become free again.
+    New keys take the least used palette color, scanning round-robin from the last
+    assignment, which reproduces the plain len(color_map) % len(colors) sequence
+    until the first eviction.
+    """
+    __slots__ = ("colors", "capacity", "ttl", "entries", "usage", "cursor", "hits", "misses", "evictions")
+
+    def __init__(self, colors, capacity=1000, ttl=0.0):
+        self.colors = colors
+        self.capacity = capacity
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.usage = [0] * len(colors)
+        self.cursor = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, capacity, ttl):
+        self.capacity = capacity
+        self.ttl = ttl
+        while len(self.entries) > self.capacity:
+            self._evict_oldest()
+
+    def assign(self, keys):
+        """
+        Returns {key: color} for every key, assigning colors to unseen keys.
+        """
+        entries = self.entries
+        now = time.monotonic()
+        if self.ttl > 0:
+            while entries and now - next(iter(entries.values()))[1] > self.ttl:
+                self._evict_oldest()
+
+        color_dict = {}
+        for key in keys:
+            if key in color_dict:
+                continue
+            entry = entries.get(key)
+            if entry is None:
+                self.misses += 1
+                if len(entries) >= self.capacity:
+                    self._evict_oldest()
+                index = self._next_index()
+                self.usage[index] += 1
+            else:
+                self.hits += 1
+                index = entry[0]
+                entries.move_to_end(key)
+            entries[key] = (index, now)
+            color_dict[key] = self.colors[index]
+        return color_dict
+
+    def touch(self, keys):
+        """
+        Marks already assigned keys as seen now, as assign() would, without assigning
+        colors. Returns {key: color} like assign(), or None as soon as a key has no color.
+        """
+        entries = self.entries
+        now = time.monotonic()
+        if self.ttl > 0:
+            while entries and now - next(iter(entries.values()))[1] > self.ttl:
+                self._evict_oldest()
+        color_dict = {}
+        for key in keys:
+            if key in color_dict:
+                continue
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            entries.move_to_end(key)
+            entries[key] = (entry[0], now)
+            color_dict[key] = self.colors[entry[0]]
+        return color_dict
+
+    def stats(self):
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def _next_index(self):
+        size = len(self.colors)
+        usage = self.usage
+        index = min(range(self.cursor, self.cursor + size), key=lambda i: usage[i % size]) % size
+        self.cursor = index + 1
+        return index
+
+    def _evict_oldest(self):
+        _, (index, _) = self.entries.popitem(last=False)
+        self.usage[index] -= 1
+        self.evictions += 1
@@ -0,0 +1,82 @@
+import numpy as np
+
+
+def detection_extents(columns, rotated):
+    """
+    Axis-aligned [x0, y0, x1, y1] extents of every detection as a (N, 4) float32 array,
+    taken from its rotated box, the rectangle fitted to its keyPoint polygon (rows set in
+    rotated) or its bbox, in that order. Rows with none of these are left undefined.
+
+    Polygon extents are one np.minimum/np.maximum.reduceat pass over the flat point
+    buffer, grown to bound any rectangle fitted to the polygon, so no rectangle has to
+    be fitted to know where a detection may be drawn.
+    """
+    extents = np.empty((columns.count, 4), dtype=np.float32)
+    left, top, width, height = columns.bboxes.T
+    extents[:, 0], extents[:, 1] = left, top
+    extents[:, 2], extents[:, 3] = left + width, top + height
+
+    rotated_idx = np.flatnonzero(rotated)
+    if len(rotated_idx):
+        counts = columns.kp_counts
+        filled = np.flatnonzero(counts > 0)
+        # Starts of the non-empty polygons are strictly increasing and their runs tile
+        # the point buffer, so reduceat yields exactly one polygon per segment
+        starts = columns.kp_offsets[filled]
+        lows = np.empty((columns.count, 2), dtype=np.float32)
+        highs = np.empty((columns.count, 2), dtype=np.float32)
+        lows[filled] = np.minimum.reduceat(columns.kp_points, starts, axis=0)
+        highs[filled] = np.maximum.reduceat(columns.kp_points, starts, axis=0)
+        # The fitted rectangle can reach past the polygon's extent: each of its corners
+        # lies on the circle over two hull points, so it stays within half the other
+        # side of the extent
+        lows, highs = lows[rotated_idx], highs[rotated_idx]
+        grow = (highs - lows)[:, ::-1] / 2
+        extents[rotated_idx, :2] = lows - grow
+        extents[rotated_idx, 2:] = highs + grow
+
+    oriented_idx = np.flatnonzero(columns.has_obb)
+    if len(oriented_idx):
+        cx, cy, w, h, angle = columns.obb[oriented_idx].T
+        theta = np.deg2rad(angle)
+        cos, sin = np.abs(np.cos(theta)), np.abs(np.sin(theta))
+        half_x = (w * cos + h * sin) / 2
+        half_y = (w * sin + h * cos) / 2
+        extents[oriented_idx] = np.stack((cx - half_x, cy - half_y, cx + half_x, cy + half_y), axis=1)
+    return extents
+
+
+def cull_extents(extents, shape, margin, min_size):
+    """
+    Splits detections by visibility in a frame of the given shape.
+
+    Returns (visible, collapsed) boolean masks: visible rows have an extent that reaches
+    into the frame once grown by margin, and collapsed rows are the visible ones whose
+    longer side is below min_size, which are drawn as a point marker instead of a box.
+    """
+    height, width = shape[:2]
+    x0, y0, x1, y1 = extents.T
+    visible = (x1 >= -margin) & (y1 >= -margin) & (x0 < width + margin) & (y0 < height + margin)
+    collapsed = visible & (np.maximum(x1 - x0, y1 - y0) < min_size)
+    return visible, collapsed
+
+
+def marker_corners(extents):
+    """
+    (N, 4, 2) degenerate boxes with all four corners on the extent centers, which
+    cv2.polylines renders as a round dot of the line thickness.
+    """
+    centers = (extents[:, :2] + extents[:, 2:]) / 2
+    return np.repeat(centers[:, None], 4, axis=1)
+
+
+def clip_corners(corners, shape, margin):
+    """
+    Clamps corners in place to the frame grown by margin. Exact for axis-aligned boxes:
+    an edge moved onto the margin still lies outside the frame, so the visible part of
+    the box is unchanged while its coordinates stay frame sized.
+    """
+    height, width = shape[:2]
+    np.clip(corners[..., 0], -margin, width - 1 + margin, out=corners[..., 0])
+    np.clip(corners[..., 1], -margin, height - 1 + margin, out=corners[..., 1])
+    return corners
@@ -0,0 +1,226 @@
+from itertools import chain
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.masks import mask_polygon
+from components.DrawBoundingRectangle.src.utils.scratch import BufferPool
+
+_point_item = itemgetter("cx", "cy")
+_point_attr = attrgetter("cx", "cy")
+_bbox_item = itemgetter("left", "top", "width", "height")
+_bbox_attr = attrgetter("left", "top", "width", "height")
+_obb_item = itemgetter("cx", "cy", "width", "height", "angle")
+_obb_attr = attrgetter("cx", "cy", "width", "height", "angle")
+
+# What reading a malformed field raises: a missing key, a non-numeric value, a wrong shape
+PARSE_ERRORS = (KeyError, TypeError, ValueError, AttributeError, IndexError)
+# Detection fields in the order DetectionColumns reads them
+DETECTION_FIELDS = ("classId", "trackerID", "classLabel", "confidence", "boundingBox", "rotatedBox", "angle", "keyPoints",
+                    "mask")
+
+# Lean-mode keyPoint buffers, keyed by their power-of-two row capacity
+POINT_POOL = BufferPool(lambda capacity: np.empty((capacity, 2), dtype=np.int32), idle=2, keys=8)
+
+
+class DetectionColumns:
+    """
+    Columnar view of inputDetections, built once per request.
+
+    Dict and pydantic detections are read in a single pass; afterwards every consumer
+    works on flat arrays instead of re-checking the detection type per field and per point.
+    KeyPoints are stored ragged: polygon i is kp_points[kp_offsets[i]:kp_offsets[i + 1]].
+    Detections carrying a mask payload instead of keyPoints contribute its contour vertices.
+    Oriented boxes that arrive precomputed, as a rotatedBox or as an angle applied to the
+    boundingBox around its center, are kept as [cx, cy, w, h, angle] rows in obb.
+    geometry holds the (indices, rects, corners) of the boxes drawn from these columns,
+    when the drawer is asked to keep them; frames drawing one shared detection list each
+    get their own view(), so geometry is never shared between frames.
+    With lean=True, kp_points is filled straight into a buffer from POINT_POOL, which
+    release() hands back once the points are no longer read.
+    """
+    __slots__ = ("count", "class_ids", "tracker_ids", "class_labels", "confidences", "bboxes", "has_bbox", "kp_offsets",
+                 "kp_points", "obb", "has_obb", "geometry", "buffer")
+
+    def __init__(self, class_ids, tracker_ids, class_labels, confidences, bboxes, has_bbox, kp_offsets, kp_points, obb,
+                 has_obb):
+        self.count = len(class_ids)
+        self.class_ids = class_ids
+        self.tracker_ids = tracker_ids
+        self.class_labels = class_labels
+        self.confidences = confidences
+        self.bboxes = bboxes
+        self.has_bbox = has_bbox
+        self.kp_offsets = kp_offsets
+        self.kp_points = kp_points
+        self.obb = obb
+        self.has_obb = has_obb
+        self.geometry = None
+        self.buffer = None
+
+    @classmethod
+    def from_detections(cls, detections, lean=False):
+        """
+        Builds the columns of a detection list. A detection whose fields cannot be read
+        raises a ValueError naming its index and field.
+        """
+        try:
+            return cls._parse(detections, lean)
+        except PARSE_ERRORS as exc:
+            raise malformed_detection(detections, exc) from exc
+
+    @classmethod
+    def _parse(cls, detections, lean):
+        count = len(detections)
+        class_ids = np.zeros(count, dtype=np.int64)
+        tracker_ids = np.zeros(count, dtype=np.int64)
+        class_labels = [None] * count
+        confidences = np.full(count, np.nan)
+        bboxes = np.zeros((count, 4), dtype=np.float64)
+        has_bbox = np.zeros(count, dtype=bool)
+        kp_offsets = np.zeros(count + 1, dtype=np.int64)
+        obb = np.zeros((count, 5), dtype=np.float32)
+        has_obb = np.zeros(count, dtype=bool)
+        flat = []
+        polygons = []
+        vertices = 0
+
+        for idx, detection in enumerate(detections):
+            is_dict = isinstance(detection, dict)
+            if is_dict:
+                class_id = detection.get("classId")
+                tracker_id = detection.get("trackerID")
+                class_label = detection.get("classLabel")
+                confidence = detection.get("confidence")
+                bbox = detection.get("boundingBox")
+                key_points = detection.get("keyPoints")
+                rotated_box = detection.get("rotatedBox")
+                angle = detection.get("angle")
+                mask = detection.get("mask")
+            else:
+                class_id = getattr(detection, "classId", None)
+                tracker_id = getattr(detection, "trackerID", None)
+                class_label = getattr(detection, "classLabel", None)
+                confidence = getattr(detection, "confidence", None)
+                bbox = getattr(detection, "boundingBox", None)
+                key_points = getattr(detection, "keyPoints", None)
+                rotated_box = getattr(detection, "rotatedBox", None)
+                angle = getattr(detection, "angle", None)
+                mask = getattr(detection, "mask", None)
+
+            class_ids[idx] = class_id or 0
+            tracker_ids[idx] = tracker_id or 0
+            class_labels[idx] = class_label
+            if confidence is not None:
+                confidences[idx] = confidence
+            if bbox:
+                bboxes[idx] = _bbox_item(bbox) if isinstance(bbox, dict) else _bbox_attr(bbox)
+                has_bbox[idx] = True
+            if rotated_box:
+                obb[idx] = _obb_item(rotated_box) if isinstance(rotated_box, dict) else _obb_attr(rotated_box)
+                has_obb[idx] = True
+            elif angle is not None and bbox:
+                left, top, width, height = bboxes[idx]
+                obb[idx] = left + width / 2, top + height / 2, width, height, angle
+                has_obb[idx] = True
+            polygon = key_points or (mask_polygon(mask) if mask else None)
+            if polygon is not None:
+                vertices += len(polygon)
+                if lean:
+                    polygons.append(polygon)
+                elif isinstance(polygon, np.ndarray):
+                    flat.extend(polygon.ravel().tolist())
+                else:
+                    getter = _point_item if isinstance(polygon[0], dict) else _point_attr
+                    flat.extend(chain.from_iterable(map(getter, polygon)))
+            kp_offsets[idx + 1] = vertices
+
+        if not lean:
+            # KeyPoints are truncated to whole pixels, as int(cx), int(cy) would
+            kp_points = np.array(flat, dtype=np.float64).reshape(-1, 2).astype(np.int32)
+            return cls(class_ids, tracker_ids, class_labels, confidences, bboxes, has_bbox, kp_offsets, kp_points, obb,
+                       has_obb)
+
+        buffer = POINT_POOL.checkout(1 << max(vertices - 1, 0).bit_length())
+        kp_points = buffer[:vertices]
+        start = 0
+        for polygon in polygons:
+            end = start + len(polygon)
+            if isinstance(polygon, np.ndarray):
+                kp_points[start:end] = polygon
+            else:
+                getter = _point_item if isinstance(polygon[0], dict) else _point_attr
+                values = np.fromiter(chain.from_iterable(map(getter, polygon)), dtype=np.float64, count=2 * (end - start))
+                # Assigning float coordinates truncates them, as astype(np.int32) does
+                kp_points[start:end] = values.reshape(-1, 2)
+            start = end
+        columns = cls(class_ids, tracker_ids, class_labels, confidences, bboxes, has_bbox, kp_offsets, kp_points, obb, has_obb)
+        columns.buffer = buffer
+        return columns
+
+    def view(self):
+        """
+        Columns sharing this object's arrays with a geometry of their own, for frames
+        drawing the same detections. The arrays are only read while drawing.
+        """
+        return DetectionColumns(self.class_ids, self.tracker_ids, self.class_labels, self.confidences, self.bboxes,
+                                self.has_bbox, self.kp_offsets, self.kp_points, self.obb, self.has_obb)
+
+    def release(self):
+        """
+        Hands a lean-mode kp_points buffer back to POINT_POOL; kp_points must not be read afterwards.
+        """
+        if self.buffer is not None:
+            POINT_POOL.release(len(self.buffer), self.buffer)
+            self.buffer = None
+
+    @property
+    def kp_counts(self):
+        return np.diff(self.kp_offsets)
+
+
+def _detection_field(detection, name):
+    return detection.get(name) if isinstance(detection, dict) else getattr(detection, name, None)
+
+
+def _describe(error):
+    return f"missing {error}" if isinstance(error, KeyError) else str(error)
+
+
+def malformed_detection(detections, error):
+    """
+    ValueError locating what DetectionColumns could not parse: the first detection that
+    fails on its own, and within it the first field that fails on its own (an angle is
+    read together with the boundingBox it rotates). Only runs once parsing has failed.
+    """
+    for idx, detection in enumerate(detections):
+        try:
+            DetectionColumns._parse([detection], False)
+        except PARSE_ERRORS as detection_error:
+            for name in DETECTION_FIELDS:
+                fields = {name: _detection_field(detection, name)}
+                if name == "angle":
+                    fields["boundingBox"] = _detection_field(detection, "boundingBox")
+                try:
+                    DetectionColumns._parse([fields], False)
+                except PARSE_ERRORS as field_error:
+                    return ValueError(f"Detection {idx} has an invalid {name}: {_describe(field_error)}")
+            return ValueError(f"Detection {idx} is malformed: {_describe(detection_error)}")
+    return ValueError(f"Malformed detections: {_describe(error)}")
+
+
+def oriented_detections(detections, columns):
+    """
+    Copies of the input detections, as dicts, with the angle and rotatedBox of every
+    drawn box filled in from columns.geometry.
+    """
+    output = [dict(detection) if isinstance(detection, dict) else detection.model_dump(exclude_none=True)
+              for detection in detections]
+    indices, rects, corners = columns.geometry
+    for idx, (cx, cy, width, height, angle), box in zip(indices.tolist(), rects.tolist(), corners.tolist()):
+        output[idx]["angle"] = angle
+        output[idx]["rotatedBox"] = {
+            "cx": cx, "cy": cy, "width": width, "height": height, "angle": angle,
+            "corners": [{"cx": x, "cy": y} for x, y in box],
+        }
+    return output
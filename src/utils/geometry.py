@@ -0,0 +1,157 @@
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+def pack_polygons(polygons):
+    """
+    Packs a sequence of (n_i, 2) point arrays into a ragged (offsets, points) pair,
+    where polygon i is points[offsets[i]:offsets[i + 1]].
+    """
+    offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    if not len(polygons):
+        return offsets, np.empty((0, 2), dtype=np.int32)
+    np.cumsum([len(p) for p in polygons], out=offsets[1:])
+    points = np.concatenate(polygons).reshape(-1, 2).astype(np.int32, copy=False)
+    return offsets, points
+
+
+def fit_rect(polygon, tolerance=0, max_vertices=0):
+    """
+    cv2.minAreaRect of one polygon as a (cx, cy, w, h, angle) tuple.
+
+    Dense mask polygons can be reduced first: max_vertices keeps an evenly strided
+    subset of at most that many vertices, and a positive tolerance simplifies the
+    polygon with Douglas-Peucker within that many pixels.
+    """
+    if max_vertices and len(polygon) > max_vertices:
+        polygon = np.ascontiguousarray(polygon[::-(-len(polygon) // max_vertices)])
+    if tolerance > 0:
+        polygon = cv2.approxPolyDP(polygon, tolerance, True)
+    (cx, cy), (w, h), angle = cv2.minAreaRect(polygon)
+    return cx, cy, w, h, angle
+
+
+def min_area_rects(offsets, points, indices=None, tolerance=0, max_vertices=0, out=None):
+    """
+    Computes the minimum-area rectangle of every polygon of a ragged batch, or only of
+    the polygons listed in indices.
+
+    Each polygon is a zero-copy slice of the flat point buffer, so the only per-detection
+    work left in Python is the cv2.minAreaRect call itself.
+
+    Returns a (N, 5) float32 array of [cx, cy, w, h, angle] rows, written into out if given.
+    """
+    if indices is None:
+        indices = range(len(offsets) - 1)
+    rects = np.empty((len(indices), 5), dtype=np.float32) if out is None else out
+    for row, i in enumerate(indices):
+        rects[row] = fit_rect(points[offsets[i]:offsets[i + 1]], tolerance, max_vertices)
+    return rects
+
+
+def box_points(rects, out=None):
+    """
+    Vectorized cv2.boxPoints: returns the (N, 4, 2) float32 corners of [cx, cy, w, h, angle]
+    rows, evaluated in the same float32 order as OpenCV's RotatedRect::points.
+    """
+    cx, cy, w, h = (rects[:, i] for i in range(4))
+    theta = rects[:, 4].astype(np.float64) * np.pi / 180.0
+    b = np.cos(theta).astype(np.float32) * np.float32(0.5)
+    a = np.sin(theta).astype(np.float32) * np.float32(0.5)
+    corners = np.empty((len(rects), 4, 2), dtype=np.float32) if out is None else out
+    corners[:, 0, 0] = cx - a * h - b * w
+    corners[:, 0, 1] = cy + b * h - a * w
+    corners[:, 1, 0] = cx + a * h - b * w
+    corners[:, 1, 1] = cy - b * h - a * w
+    corners[:, 2, 0] = cx + a * h + b * w
+    corners[:, 2, 1] = cy - b * h + a * w
+    corners[:, 3, 0] = cx - a * h + b * w
+    corners[:, 3, 1] = cy + b * h + a * w
+    return corners
+
+
+def upright_boxes(bboxes):
+    """
+    Converts (N, 4) [left, top, width, height] boxes to (N, 4, 2) corners in the
+    vertex order cv2.rectangle uses internally.
+    """
+    x1 = bboxes[:, 0].astype(np.int32)
+    y1 = bboxes[:, 1].astype(np.int32)
+    x2 = (bboxes[:, 0] + bboxes[:, 2]).astype(np.int32)
+    y2 = (bboxes[:, 1] + bboxes[:, 3]).astype(np.int32)
+    return np.stack((
+        np.stack((x1, y1), axis=-1),
+        np.stack((x2, y1), axis=-1),
+        np.stack((x2, y2), axis=-1),
+        np.stack((x1, y2), axis=-1),
+    ), axis=1)
+
+
+def upright_rects(bboxes):
+    """
+    Converts (N, 4) [left, top, width, height] boxes to (N, 5) [cx, cy, w, h, 0] rows.
+    """
+    left, top, width, height = bboxes.T
+    return np.stack([left + width / 2, top + height / 2, width, height, np.zeros_like(left)], axis=1)
+
+
+@lru_cache(maxsize=64)
+def corner_arc(radius):
+    """
+    Unit quarter-arc template for a corner of the given radius, sampled with the same
+    angular step cv2.ellipse picks for that size. Returns a read-only (K, 2) array of
+    (cos, sin) weights from 0 to 90 degrees.
+    """
+    step = 90 if radius < 3 else 30 if radius < 10 else 18 if radius < 15 else 5
+    angles = np.deg2rad(np.arange(0, 90 + step, step, dtype=np.float64))
+    arc = np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+    arc.setflags(write=False)
+    return arc
+
+
+def rounded_boxes(corners, radius):
+    """
+    Replaces every corner of (N, 4, 2) rectangles by a quarter arc of the cached corner
+    template, clamping the radius to half the shorter side of each box. Works for
+    upright and rotated boxes alike; returns (N, 4 * K, 2) int32 polygons.
+    """
+    corners = corners.astype(np.float64)
+    d_out = np.roll(corners, -1, axis=1) - corners
+    side = np.hypot(d_out[..., 0], d_out[..., 1])
+    d_out /= np.maximum(side, 1e-9)[..., None]
+    d_in = np.roll(d_out, 1, axis=1)
+    r = np.minimum(radius, side.min(axis=1) / 2)[:, None, None, None]
+
+    # Arc from corner - r * d_in to corner + r * d_out, around center corner - r * d_in + r * d_out
+    arc = corner_arc(radius)
+    center = corners - r[..., 0] * d_in + r[..., 0] * d_out
+    points = center[:, :, None] + r * (-d_out[:, :, None] * arc[:, 0, None] + d_in[:, :, None] * arc[:, 1, None])
+    return np.rint(points).astype(np.int32).reshape(len(corners), 4 * len(arc), 2)
+
+
+def draw_polygons(image, polygons, colors, thickness):
+    """
+    Draws closed (N, K, 2) int32 polygons with one cv2.polylines call per distinct color.
+    Color groups are drawn in order of first appearance, each as views on the polygon rows.
+    Where boxes of different colors overlap, the later color group ends up on top rather
+    than the later detection; non-overlapping boxes are drawn exactly as one call each.
+    """
+    groups = {}
+    for idx, color in enumerate(colors):
+        groups.setdefault(color, []).append(idx)
+    for color, indices in groups.items():
+        cv2.polylines(image, [polygons[idx] for idx in indices], True, color, thickness)
+    return image
+
+
+def reference_boxes(offsets, points):
+    """
+    Per-polygon cv2.minAreaRect/cv2.boxPoints path, kept as the ground truth the
+    batched engine is checked against by benchmarks/equivalence.py.
+    """
+    boxes = [
+        cv2.boxPoints(cv2.minAreaRect(points[offsets[i]:offsets[i + 1]]))
+        for i in range(len(offsets) - 1)
+    ]
+    return np.array(boxes, dtype=np.float32).reshape(-1, 4, 2)
@@ -0,0 +1,66 @@
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+
+@lru_cache(maxsize=16)
+def palette_ramp(colors):
+    """
+    256-entry color ramp from dark to light through a palette, as a read-only (256, 3)
+    uint8 lookup table. colors is a tuple of BGR tuples.
+
+    Sequential palettes, whose colors change monotonically in luma in their listed
+    order (viridis, greys), are interpolated through every color from the dark end.
+    Qualitative ones (tab20, custom lists) are in no meaningful order, so the ramp runs
+    from their darkest to their lightest color only. Either way the ramp is monotonic
+    in luminance and higher density always reads brighter.
+    """
+    colors = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+    luma = colors @ np.array((0.114, 0.587, 0.299), dtype=np.float32)
+    steps = np.diff(luma)
+    if np.all(steps >= 0):
+        stops = colors
+    elif np.all(steps <= 0):
+        stops = colors[::-1]
+    else:
+        stops = colors[[np.argmin(luma), np.argmax(luma)]]
+    positions = np.linspace(0, 255, len(stops)) if len(stops) > 1 else np.zeros(1)
+    levels = np.arange(256)
+    ramp = np.stack([np.interp(levels, positions, stops[:, channel]) for channel in range(3)], axis=1)
+    ramp = np.rint(ramp).astype(np.uint8)
+    ramp.setflags(write=False)
+    return ramp
+
+
+def density_grid(centers, shape, cell):
+    """
+    Detection counts per cell x cell block of a frame of the given shape, from (N, 2)
+    centers in frame coordinates, as one np.bincount over the flattened cell indices.
+    Centers outside the frame are not counted.
+    """
+    height, width = shape[:2]
+    rows, cols = -(-height // cell), -(-width // cell)
+    cells = np.floor(centers / cell).astype(np.int64)
+    inside = (cells[:, 0] >= 0) & (cells[:, 0] < cols) & (cells[:, 1] >= 0) & (cells[:, 1] < rows)
+    cells = cells[inside]
+    counts = np.bincount(cells[:, 1] * cols + cells[:, 0], minlength=rows * cols)
+    return counts.reshape(rows, cols).astype(np.float32)
+
+
+def draw_density(image, grid, ramp, opacity):
+    """
+    Blends a density grid onto the image in place: the grid is smoothed and normalized
+    to its peak at grid resolution, colorized through the ramp and upsampled once to
+    the frame. Each pixel is blended with opacity scaled by its density, so sparse
+    cells fade into the frame and empty ones leave it untouched.
+    """
+    if not grid.any():
+        return image
+    height, width = image.shape[:2]
+    grid = cv2.GaussianBlur(grid, (3, 3), 0)
+    grid *= 1 / grid.max()
+    heat = cv2.resize(ramp[np.rint(grid * 255).astype(np.uint8)], (width, height), interpolation=cv2.INTER_LINEAR)
+    alpha = cv2.resize(grid * opacity, (width, height), interpolation=cv2.INTER_LINEAR)
+    image[...] = cv2.blendLinear(heat, image, alpha, 1 - alpha)
+    return image
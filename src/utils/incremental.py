@@ -0,0 +1,91 @@
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.geometry import fit_rect
+
+
+class GeometryCache:
+    """
+    Per-stream state for incremental drawing.
+
+    minAreaRect results are kept per tracker ID together with a hash of the keyPoints,
+    so unchanged polygons skip rectangle fitting. The drawn extent and color of every
+    track is kept as well, and each frame reports the regions that differ from the
+    previous one: moved, recolored, new and vanished boxes.
+    Only tracks present in the latest frame are retained.
+    """
+    __slots__ = ("rects", "extents", "dirty", "hits")
+
+    def __init__(self):
+        self.rects = {}
+        self.extents = {}
+        self.dirty = []
+        self.hits = 0
+
+    def min_area_rects(self, columns, indices, tolerance=0, max_vertices=0):
+        offsets, points = columns.kp_offsets, columns.kp_points
+        out = np.empty((len(indices), 5), dtype=np.float32)
+        rects = {}
+        hits = 0
+        for row, (idx, key) in enumerate(zip(indices.tolist(), columns.tracker_ids[indices].tolist())):
+            polygon = points[offsets[idx]:offsets[idx + 1]]
+            digest = hash((polygon.tobytes(), tolerance, max_vertices))
+            cached = self.rects.get(key)
+            if cached is not None and cached[0] == digest:
+                rect = cached[1]
+                hits += 1
+            else:
+                rect = fit_rect(polygon, tolerance, max_vertices)
+            out[row] = rect
+            rects[key] = (digest, rect)
+        self.rects = rects
+        self.hits = hits
+        return out
+
+    def repaint(self, shape):
+        """
+        Marks the whole frame as changed, for frames not drawn box by box. The frame is
+        kept as the one extent on record, so the next frame reports it as vanished and
+        is repainted in full as well.
+        """
+        height, width = shape[:2]
+        self.extents = {None: (0, 0, width, height, None, None)}
+        self.dirty = [[0, 0, width, height]]
+        return self.dirty
+
+    def update_regions(self, keys, polygons, colors, thickness, shape, labels=None):
+        """
+        Records the extents drawn this frame and returns the changed regions as
+        [left, top, width, height] lists clipped to the frame. labels, when given, is the
+        ([x0, y0, x1, y1] boxes, texts) pair of the label drawn with each box.
+        """
+        lows = polygons.min(axis=1) - thickness
+        highs = polygons.max(axis=1) + thickness + 1
+        texts = [None] * len(keys)
+        if labels is not None:
+            boxes, texts = labels
+            lows = np.minimum(lows, boxes[:, :2])
+            highs = np.maximum(highs, boxes[:, 2:])
+        extents = {}
+        dirty = []
+        for key, low, high, color, text in zip(keys, lows.tolist(), highs.tolist(), colors, texts):
+            extent = (low[0], low[1], high[0], high[1], color, text)
+            if key in extents:
+                # Detections sharing an ID cannot be matched across frames
+                dirty.append(extent)
+                continue
+            extents[key] = extent
+            previous = self.extents.pop(key, None)
+            if previous != extent:
+                dirty.append(extent)
+                if previous is not None:
+                    dirty.append(previous)
+        dirty.extend(self.extents.values())
+        self.extents = extents
+
+        height, width = shape[:2]
+        self.dirty = []
+        for x0, y0, x1, y1, *_ in dirty:
+            x0, y0, x1, y1 = max(x0, 0), max(y0, 0), min(x1, width), min(y1, height)
+            if x0 < x1 and y0 < y1:
+                self.dirty.append([x0, y0, x1 - x0, y1 - y0])
+        return self.dirty
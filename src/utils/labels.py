@@ -0,0 +1,106 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+# Rendered label strips kept per atlas
+LABEL_CACHE_SIZE = 1024
+GLYPHS = "".join(map(chr, range(32, 127)))
+
+
+class GlyphAtlas:
+    """
+    Pre-rasterized printable ASCII glyphs of one Hershey font, scale and thickness.
+
+    Every glyph is drawn once with cv2.putText into a cell of its advance width and the
+    shared line height; a label is the concatenation of its glyph cells, so no text is
+    rasterized or measured per detection. Finished strips, colored for their box, are
+    kept in an LRU keyed by (text, color), so a track or class reuses its strip while
+    its label and color are unchanged and drawing it is a single slice copy.
+    """
+    __slots__ = ("height", "cells", "strips", "lock")
+
+    def __init__(self, font, scale, thickness):
+        sizes = [cv2.getTextSize(glyph, font, scale, thickness) for glyph in GLYPHS]
+        ascent = max(size[1] for size, _ in sizes)
+        descent = max(baseline for _, baseline in sizes)
+        self.height = ascent + descent + 2 * thickness
+        self.cells = {}
+        for glyph, ((width, _), _) in zip(GLYPHS, sizes):
+            cell = np.zeros((self.height, max(width, 1)), dtype=np.uint8)
+            cv2.putText(cell, glyph, (0, thickness + ascent), font, scale, 1, thickness, cv2.LINE_8)
+            self.cells[glyph] = cell
+        self.strips = OrderedDict()
+        self.lock = threading.Lock()
+
+    def strip(self, text, color):
+        """
+        Returns the (height, width, 3) label of text on a color background, with a
+        half-space margin on both sides.
+        """
+        key = (text, color)
+        with self.lock:
+            strip = self.strips.get(key)
+            if strip is not None:
+                self.strips.move_to_end(key)
+                return strip
+        margin = self.cells[" "][:, :max(self.cells[" "].shape[1] // 2, 1)]
+        cells = [self.cells.get(glyph, self.cells["?"]) for glyph in text]
+        coverage = np.concatenate([margin, *cells, margin], axis=1)
+        strip = np.where(coverage[..., None] != 0, np.array(text_color(color), dtype=np.uint8),
+                         np.array(color, dtype=np.uint8))
+        strip.setflags(write=False)
+        with self.lock:
+            self.strips[key] = strip
+            if len(self.strips) > LABEL_CACHE_SIZE:
+                self.strips.popitem(last=False)
+        return strip
+
+
+@lru_cache(maxsize=16)
+def glyph_atlas(font, scale, thickness):
+    return GlyphAtlas(font, scale, thickness)
+
+
+def top_edge_anchors(corners):
+    """
+    Label anchors of (N, 4, 2) boxes: the left end of each box's top edge, at the height
+    of the edge's higher end, so a strip placed above it clears the whole edge.
+    """
+    following = np.roll(corners, -1, axis=1)
+    edge = np.argmin(corners[..., 1] + following[..., 1], axis=1)[:, None, None]
+    start = np.take_along_axis(corners, edge, axis=1)[:, 0]
+    end = np.take_along_axis(following, edge, axis=1)[:, 0]
+    return np.stack((np.minimum(start[:, 0], end[:, 0]), np.minimum(start[:, 1], end[:, 1])), axis=1).astype(np.int32)
+
+
+def text_color(color):
+    # Dark text on light boxes, light text on dark ones (BGR luma)
+    return (0, 0, 0) if 0.114 * color[0] + 0.587 * color[1] + 0.299 * color[2] > 150 else (255, 255, 255)
+
+
+def label_boxes(anchors, strips):
+    """
+    [x0, y0, x1, y1] frame boxes of label strips: each strip sits on its anchor, or hangs
+    below it when the frame has no room above.
+    """
+    sizes = np.array([strip.shape[:2] for strip in strips], dtype=np.int32).reshape(-1, 2)
+    x, y = anchors[:, 0], anchors[:, 1]
+    top = np.where(y >= sizes[:, 0], y - sizes[:, 0], y)
+    return np.stack((x, top, x + sizes[:, 1], top + sizes[:, 0]), axis=1)
+
+
+def draw_labels(image, boxes, strips):
+    """
+    Blits each label strip into its box with one NumPy slice copy, clipped to the frame.
+    """
+    height, width = image.shape[:2]
+    for (x, top, right, bottom), strip in zip(boxes.tolist(), strips):
+        x0, y0 = max(x, 0), max(top, 0)
+        x1, y1 = min(right, width), min(bottom, height)
+        if x0 < x1 and y0 < y1:
+            image[y0:y1, x0:x1] = strip[y0 - top:y1 - top, x0 - x:x1 - x]
+    return image
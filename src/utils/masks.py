@@ -0,0 +1,77 @@
+import base64
+
+import cv2
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.transport import attach_frame
+
+
+# Fields each mask encoding cannot be decoded without
+MASK_FIELDS = {
+    "rle": ("width", "height", "counts"),
+    "bitpacked": ("width", "height", "data"),
+    "shared": ("handle",),
+}
+
+
+def missing_mask_fields(encoding, fields):
+    """
+    Names of the fields encoding requires that are None in fields, a name -> value mapping.
+    """
+    return [name for name in MASK_FIELDS.get(encoding, ()) if fields.get(name) is None]
+
+
+def require_mask_fields(encoding, fields):
+    """
+    Raises ValueError naming the fields encoding requires that are None in fields.
+    """
+    missing = missing_mask_fields(encoding, fields)
+    if missing:
+        raise ValueError(f"'{encoding}' mask payload is missing {', '.join(missing)}.")
+
+
+def _field(payload, name):
+    return payload.get(name) if isinstance(payload, dict) else getattr(payload, name, None)
+
+
+def decode_mask(payload):
+    """
+    Decodes a mask payload into a (height, width) uint8 array of 0/1 values.
+
+    'rle' counts alternate runs of 0 and 1 in row-major order, starting with 0;
+    'bitpacked' is base64 of np.packbits over the row-major mask; 'shared' maps the
+    mask from a shared-memory frame handle, as written by SharedFrameRing.
+    """
+    encoding = _field(payload, "encoding")
+    require_mask_fields(encoding, {name: _field(payload, name) for name in MASK_FIELDS.get(encoding, ())})
+    if encoding == "shared":
+        mask = attach_frame(_field(payload, "handle"))
+        # cv2.findContours only takes single-channel 8-bit masks
+        if mask.dtype != np.uint8 or mask.ndim not in (2, 3) or mask.ndim == 3 and mask.shape[2] != 1:
+            raise ValueError(f"Shared mask must be single-channel uint8, got {mask.dtype} with shape {mask.shape}.")
+        return mask.reshape(mask.shape[:2])
+    height, width = _field(payload, "height"), _field(payload, "width")
+    if encoding == "rle":
+        counts = np.asarray(_field(payload, "counts"), dtype=np.int64)
+        mask = np.repeat(np.arange(len(counts), dtype=np.uint8) & 1, counts)
+        if len(mask) != height * width:
+            raise ValueError(f"RLE mask covers {len(mask)} pixels, expected {height}x{width}.")
+        return mask.reshape(height, width)
+    if encoding == "bitpacked":
+        packed = np.frombuffer(base64.b64decode(_field(payload, "data")), dtype=np.uint8)
+        return np.unpackbits(packed, count=height * width).reshape(height, width)
+    raise ValueError(f"Unknown mask encoding: '{encoding}'.")
+
+
+def mask_polygon(payload):
+    """
+    Outline of a mask payload in frame coordinates: the vertices of its external
+    contours, offset by the payload's left/top. Rectangle fitting over these vertices
+    equals fitting over every mask pixel, as both share the same convex hull.
+    """
+    contours, _ = cv2.findContours(decode_mask(payload), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return np.empty((0, 2), dtype=np.int32)
+    polygon = np.concatenate(contours).reshape(-1, 2)
+    polygon += (_field(payload, "left") or 0, _field(payload, "top") or 0)
+    return polygon
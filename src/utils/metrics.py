@@ -0,0 +1,121 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# Stage and counter names, in reporting order
+STAGES = ("parse", "get_frame", "select_color", "resize", "min_area_rect", "draw", "set_frame", "build_response")
+COUNTERS = ("frames", "detections", "vertices", "boxes_drawn", "oriented", "rotated", "upright",
+            "culled", "collapsed", "heatmap_frames", "color_hits", "color_misses", "color_evictions",
+            "geometry_cache_hits", "geometry_cache_misses", "render_cache_hits", "render_cache_misses",
+            "render_cache_evictions")
+
+PROMETHEUS_PREFIX = "draw_bounding_rectangle"
+
+
+class StageMetrics:
+    """
+    Per-request stage timings and counters.
+
+    Each stage accumulates wall time and CPU time of the calling thread, so stages run
+    on the batch pool are not charged for the work of other threads.
+    """
+    __slots__ = ("wall", "cpu", "counts", "lock")
+
+    enabled = True
+
+    def __init__(self):
+        self.wall = dict.fromkeys(STAGES, 0.0)
+        self.cpu = dict.fromkeys(STAGES, 0.0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            with self.lock:
+                self.wall[name] += wall
+                self.cpu[name] += cpu
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counts[name] += value
+
+    def as_dict(self):
+        return {
+            "wallMs": {name: round(seconds * 1e3, 4) for name, seconds in self.wall.items()},
+            "cpuMs": {name: round(seconds * 1e3, 4) for name, seconds in self.cpu.items()},
+            "counts": dict(self.counts),
+        }
+
+
+class NullMetrics:
+    """
+    Disabled instrumentation: stage() hands back one shared no-op context manager.
+    """
+    __slots__ = ()
+
+    enabled = False
+    _stage = nullcontext()
+
+    def stage(self, name):
+        return self._stage
+
+    def count(self, name, value=1):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class MetricsRegistry:
+    """
+    Process-wide totals of every instrumented request, exported as Prometheus text.
+    """
+    def __init__(self):
+        self.requests = 0
+        self.wall = dict.fromkeys(STAGES, 0.0)
+        self.cpu = dict.fromkeys(STAGES, 0.0)
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.lock = threading.Lock()
+
+    def record(self, metrics):
+        with self.lock:
+            self.requests += 1
+            for name in STAGES:
+                self.wall[name] += metrics.wall[name]
+                self.cpu[name] += metrics.cpu[name]
+            for name in COUNTERS:
+                self.counts[name] += metrics.counts[name]
+
+    def to_prometheus(self, prefix=PROMETHEUS_PREFIX):
+        with self.lock:
+            lines = [
+                f"# HELP {prefix}_requests_total Instrumented requests.",
+                f"# TYPE {prefix}_requests_total counter",
+                f"{prefix}_requests_total {self.requests}",
+                f"# HELP {prefix}_stage_seconds_total Wall time spent per stage.",
+                f"# TYPE {prefix}_stage_seconds_total counter",
+            ]
+            lines += [f'{prefix}_stage_seconds_total{{stage="{name}"}} {self.wall[name]:.6f}' for name in STAGES]
+            lines += [
+                f"# HELP {prefix}_stage_cpu_seconds_total Thread CPU time spent per stage.",
+                f"# TYPE {prefix}_stage_cpu_seconds_total counter",
+            ]
+            lines += [f'{prefix}_stage_cpu_seconds_total{{stage="{name}"}} {self.cpu[name]:.6f}' for name in STAGES]
+            for name in COUNTERS:
+                lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {self.counts[name]}"]
+            lookups = self.counts["render_cache_hits"] + self.counts["render_cache_misses"]
+            if lookups:
+                lines += [
+                    f"# HELP {prefix}_render_cache_hit_ratio Share of render cache lookups answered from the cache.",
+                    f"# TYPE {prefix}_render_cache_hit_ratio gauge",
+                    f"{prefix}_render_cache_hit_ratio {self.counts['render_cache_hits'] / lookups:.6f}",
+                ]
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,65 @@
+import cv2
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.scratch import BufferPool
+
+# Idle canvases kept between frames: OVERLAY_IDLE_CANVASES per (frame shape, dtype), for up to OVERLAY_POOL_SIZE of them
+OVERLAY_POOL_SIZE = 4
+OVERLAY_IDLE_CANVASES = 2
+
+
+class OverlayCanvas:
+    """
+    Reusable overlay and coverage mask for one frame geometry. Only the region touched
+    by the previous frame is cleared, so reuse costs no full-frame allocation or fill.
+    """
+    __slots__ = ("overlay", "mask")
+
+    def __init__(self, shape, dtype):
+        self.overlay = np.zeros(shape, dtype=dtype)
+        self.mask = np.zeros(shape[:2], dtype=np.uint8)
+
+
+# Shared by every drawing thread: a canvas is checked out for one frame and returned clean
+_canvases = BufferPool(lambda key: OverlayCanvas(key[0], key[1]), idle=OVERLAY_IDLE_CANVASES, keys=OVERLAY_POOL_SIZE)
+
+
+def composite_polygons(image, polygons, colors, thickness, opacity=1.0):
+    """
+    Rasterizes closed (N, K, 2) int32 polygons onto a pooled overlay, one cv2.polylines
+    call per color plus one for the coverage mask, then blends the covered pixels onto
+    the image in a single pass.
+    """
+    if not len(polygons):
+        return image
+    key = (image.shape, np.dtype(image.dtype).str)
+    canvas = _canvases.checkout(key)
+
+    groups = {}
+    for idx, color in enumerate(colors):
+        groups.setdefault(color, []).append(idx)
+    for color, indices in groups.items():
+        cv2.polylines(canvas.overlay, list(polygons[indices]), True, color, thickness)
+    cv2.polylines(canvas.mask, list(polygons), True, 255, thickness)
+
+    # Restrict the blend and the clean-up to the region the polygons can touch
+    height, width = image.shape[:2]
+    x0, y0 = np.maximum(polygons.reshape(-1, 2).min(axis=0) - thickness, 0)
+    x1, y1 = polygons.reshape(-1, 2).max(axis=0) + thickness + 1
+    x1, y1 = min(int(x1), width), min(int(y1), height)
+    if x0 >= x1 or y0 >= y1:
+        _canvases.release(key, canvas)
+        return image
+    region = (slice(y0, y1), slice(x0, x1))
+
+    target, overlay, mask = image[region], canvas.overlay[region], canvas.mask[region]
+    covered = mask != 0
+    if opacity >= 1:
+        target[covered] = overlay[covered]
+    else:
+        target[covered] = cv2.addWeighted(overlay[covered], opacity, target[covered], 1 - opacity, 0)
+    # The canvas goes back to the pool only once its drawn region is clean again
+    overlay[...] = 0
+    mask[...] = 0
+    _canvases.release(key, canvas)
+    return image
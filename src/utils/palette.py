@@ -0,0 +1,56 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.colormaps import QUALITATIVE_COLORMAPS
+
+# Compiled palettes kept per process, least recently used evicted first
+PALETTE_CACHE_SIZE = 32
+
+_palettes = OrderedDict()
+
+
+def compile_palette(palette_name, palette):
+    """
+    Returns the palette as a read-only contiguous (N, 3) uint8 array in the channel
+    order handed to OpenCV.
+
+    palette is the ConfigPaletteSize value for colormaps and the configCustomColors
+    hex string for "custom". Compiled palettes are cached by (palette_name, palette),
+    so switching between palettes is a dictionary lookup.
+    """
+    key = (palette_name, palette)
+    colors = _palettes.get(key)
+    if colors is not None:
+        _palettes.move_to_end(key)
+        return colors
+
+    if palette_name == "custom":
+        colors = _parse_custom(palette)
+    else:
+        colors = _sample_colormap(palette_name, palette)
+    colors.setflags(write=False)
+
+    _palettes[key] = colors
+    if len(_palettes) > PALETTE_CACHE_SIZE:
+        _palettes.popitem(last=False)
+    return colors
+
+
+def _parse_custom(hex_colors):
+    bgr = []
+    for color_str in hex_colors.split(','):
+        clean_hex = color_str.strip().lstrip('#')
+        if len(clean_hex) == 6:
+            bgr.append((int(clean_hex[4:6], 16), int(clean_hex[2:4], 16), int(clean_hex[0:2], 16)))
+    return np.array(bgr, dtype=np.uint8).reshape(-1, 3)
+
+
+def _sample_colormap(palette_name, size):
+    table = QUALITATIVE_COLORMAPS.get(palette_name)
+    if table is None:
+        # Colormaps outside the embedded table still resolve through matplotlib
+        import matplotlib.pyplot as plt
+        table = [tuple(int(255 * r) for r in color) for color in plt.get_cmap(palette_name).colors]
+    cmap = np.array(table, dtype=np.uint8)
+    return np.ascontiguousarray(cmap[np.arange(size) % len(cmap)])
@@ -0,0 +1,91 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def columns_digest(columns):
+    """
+    Content digest of a DetectionColumns, hashed straight from its array buffers.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (columns.class_ids, columns.tracker_ids, columns.confidences, columns.bboxes, columns.has_bbox,
+                  columns.kp_offsets, columns.kp_points, columns.obb, columns.has_obb):
+        digest.update(array.data)
+    digest.update("\0".join(map(str, columns.class_labels)).encode())
+    return digest.digest()
+
+
+class RenderCache:
+    """
+    Bounded, content-addressed store of finished renders.
+
+    Keys combine the input frame reference, the detections digest and the drawing
+    configuration; values are what a render produced (the stored output image
+    reference and any side outputs), so a repeated request can be answered without
+    drawing or writing the frame again. Entries are evicted least recently used once
+    capacity is reached, and expire ttl seconds after they were stored (0 disables
+    expiry), which should not exceed how long stored frames stay addressable.
+    Streaming looks renders up and stores them from different threads, so every
+    operation holds the cache's lock.
+    """
+    __slots__ = ("capacity", "ttl", "entries", "hits", "misses", "evictions", "lock")
+
+    def __init__(self, capacity=256, ttl=60.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def configure(self, capacity, ttl):
+        with self.lock:
+            self.capacity = capacity
+            self.ttl = ttl
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and self.ttl > 0 and time.monotonic() - entry[0] > self.ttl:
+                del self.entries[key]
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def reject(self, key):
+        """
+        Drops an entry that get() returned but the caller could not use, counting that
+        lookup as a miss instead of a hit.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+            self.hits -= 1
+            self.misses += 1
+
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,11 +1,20 @@
 
 from sdks.novavision.src.helper.package import PackageHelper
-from components.DrawBoundingRectangle.src.models.PackageModel import PackageConfigs, ConfigExecutor,PackageModel,OutputImage,DrawBoundingRectangleOutputs,DrawBoundingRectangleExecutor,DrawBoundingRectangleResponse
+from components.DrawBoundingRectangle.src.models.PackageModel import PackageConfigs, ConfigExecutor,PackageModel,OutputImage,DrawBoundingRectangleOutputs,OutputDirtyRegions,OutputMetrics,OutputFrameHandle,OutputDetections,DrawBoundingRectangleExecutor,DrawBoundingRectangleResponse
 
 
 def build_response(context):
     output_image = OutputImage(value=context.image)
-    detect_outputs = DrawBoundingRectangleOutputs(outputImage=output_image)
+    outputs = {"outputImage": output_image}
+    if context.dirty_regions is not None:
+        outputs["outputDirtyRegions"] = OutputDirtyRegions(value=context.dirty_regions)
+    if context.metrics.enabled:
+        outputs["outputMetrics"] = OutputMetrics(value=context.metrics.as_dict())
+    if context.frame_handle is not None:
+        outputs["outputFrameHandle"] = OutputFrameHandle(value=context.frame_handle)
+    if context.output_detections is not None:
+        outputs["outputDetections"] = OutputDetections(value=context.output_detections)
+    detect_outputs = DrawBoundingRectangleOutputs(**outputs)
     draw_BoundingRectangle_response = DrawBoundingRectangleResponse(outputs=detect_outputs)
     draw_BoundingRectangle_executor = DrawBoundingRectangleExecutor(value=draw_BoundingRectangle_response)
     executor = ConfigExecutor(value=draw_BoundingRectangle_executor)
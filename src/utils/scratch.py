@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_local = threading.local()
+
+
+class ScratchBuffers:
+    """
+    Growable work arrays for the lean memory mode, one set per thread.
+
+    take() returns a view on the front of a named buffer that only ever grows, to the
+    next power of two, so once a stream has seen its largest frame the geometry of
+    every further frame is computed without allocating array memory. A view stays
+    valid until the same name is taken again on the same thread.
+    """
+    __slots__ = ("buffers",)
+
+    def __init__(self):
+        self.buffers = {}
+
+    def take(self, name, shape, dtype):
+        size = int(np.prod(shape))
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.size < size or buffer.dtype != dtype:
+            buffer = self.buffers[name] = np.empty(1 << max(size - 1, 0).bit_length(), dtype=dtype)
+        return buffer[:size].reshape(shape)
+
+
+def scratch_buffers():
+    buffers = getattr(_local, "scratch", None)
+    if buffers is None:
+        buffers = _local.scratch = ScratchBuffers()
+    return buffers
+
+
+class BufferPool:
+    """
+    Process-wide free lists of reusable buffers, shared by every thread.
+
+    checkout() hands out an idle buffer made for the key, or a new one from factory;
+    release() gives it back. Up to idle buffers are kept per key and keys distinct keys
+    overall, least recently used first out, so a pool holds the buffers in use plus a
+    bounded reserve however many threads draw at once.
+    """
+    __slots__ = ("factory", "idle", "keys", "free", "lock")
+
+    def __init__(self, factory, idle=2, keys=4):
+        self.factory = factory
+        self.idle = idle
+        self.keys = keys
+        self.free = OrderedDict()
+        self.lock = threading.Lock()
+
+    def checkout(self, key):
+        with self.lock:
+            buffers = self.free.get(key)
+            if buffers:
+                self.free.move_to_end(key)
+                return buffers.pop()
+        return self.factory(key)
+
+    def release(self, key, buffer):
+        with self.lock:
+            buffers = self.free.get(key)
+            if buffers is None:
+                buffers = self.free[key] = []
+                if len(self.free) > self.keys:
+                    self.free.popitem(last=False)
+            else:
+                self.free.move_to_end(key)
+            if len(buffers) < self.idle:
+                buffers.append(buffer)
+
+
+def drawable(frame):
+    """
+    The frame itself when it can be drawn on in place, otherwise a writable contiguous copy.
+    """
+    if frame.flags.writeable and frame.flags.c_contiguous:
+        return frame
+    return np.array(frame, order="C")
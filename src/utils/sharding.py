@@ -0,0 +1,56 @@
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from components.DrawBoundingRectangle.src.utils.batch import shard_pool
+from components.DrawBoundingRectangle.src.utils.geometry import fit_rect
+
+# Fewest polygons per shard; smaller shards cost more in dispatch than they save
+MIN_SHARD_SIZE = 64
+
+
+def _fit_range(points, starts, ends, tolerance, max_vertices):
+    rects = np.empty((len(starts), 5), dtype=np.float32)
+    for row, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        rects[row] = fit_rect(points[start:end], tolerance, max_vertices)
+    return rects
+
+
+def _fit_shared(name, shape, starts, ends, tolerance, max_vertices):
+    # Runs in a pool process: the keyPoints are read in place from the parent's block
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        points = np.ndarray(shape, dtype=np.int32, buffer=memory.buf)
+        rects = _fit_range(points, starts, ends, tolerance, max_vertices)
+        del points
+    finally:
+        memory.close()
+    return rects
+
+
+def sharded_min_area_rects(offsets, points, indices, tolerance=0, max_vertices=0, processes=False):
+    """
+    min_area_rects over a pool: indices are split into contiguous shards, one per core,
+    and the shard results are concatenated in order, so rows match the serial result
+    exactly. Process shards read the keyPoints from one shared-memory copy instead of
+    receiving them pickled.
+    """
+    shards = min(os.cpu_count() or 1, -(-len(indices) // MIN_SHARD_SIZE))
+    bounds = [(offsets[shard], offsets[shard + 1]) for shard in np.array_split(indices, max(shards, 1))]
+    pool = shard_pool(processes)
+    if not processes:
+        futures = [pool.submit(_fit_range, points, starts, ends, tolerance, max_vertices) for starts, ends in bounds]
+        return np.concatenate([future.result() for future in futures])
+
+    memory = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+    try:
+        shared = np.ndarray(points.shape, dtype=np.int32, buffer=memory.buf)
+        shared[:] = points
+        del shared
+        futures = [pool.submit(_fit_shared, memory.name, points.shape, starts, ends, tolerance, max_vertices)
+                   for starts, ends in bounds]
+        return np.concatenate([future.result() for future in futures])
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,91 @@
+import asyncio
+
+# Frames allowed to wait between two pipeline stages before the earlier stage stalls
+STREAM_QUEUE_DEPTH = 2
+
+_DONE = object()
+
+
+async def _produce(components, sink, step):
+    try:
+        if hasattr(components, "__aiter__"):
+            async for component in components:
+                await sink.put((component, await asyncio.to_thread(step, component)))
+        else:
+            for component in components:
+                await sink.put((component, await asyncio.to_thread(step, component)))
+        await sink.put(_DONE)
+    except Exception as exc:
+        await sink.put(exc)
+
+
+def _fetch(component):
+    # Frames answered from the render cache are not fetched
+    key, entry = component.lookup_render()
+    return key, entry, component.fetch_frame() if entry is None else None
+
+
+def _render(component, item):
+    # Colors are touched in this stage, the only one assigning them
+    key, entry, img = item
+    if entry is not None:
+        if component.replay_render(key, entry):
+            return key, True, None
+        img = component.fetch_frame()
+    return key, False, component.render_frame(img)
+
+
+def _store(component, item):
+    key, replayed, img = item
+    if replayed:
+        return component.respond()
+    response = component.store_frame(img)
+    component.store_render(key)
+    return response
+
+
+async def _forward(source, sink, step):
+    while True:
+        item = await source.get()
+        if item is _DONE or isinstance(item, Exception):
+            await sink.put(item)
+            return
+        component, img = item
+        try:
+            await sink.put((component, await asyncio.to_thread(step, component, img)))
+        except Exception as exc:
+            await sink.put(exc)
+            return
+
+
+async def stream(components, depth=STREAM_QUEUE_DEPTH):
+    """
+    Runs single-frame DrawBoundingRectangle components, one per frame, as a three-stage
+    pipeline: frame N+1 is fetched while frame N is drawn and frame N-1 is stored.
+
+    Stages are joined by queues holding at most depth frames, so a slow stage holds back
+    the ones before it instead of letting frames pile up. Each stage handles frames in
+    arrival order, which keeps color assignment and incremental state deterministic, and
+    responses are yielded in input order. components may be an iterable or an async
+    iterable; the first error raised by any stage is re-raised here. Frames found in the
+    render cache skip fetching, drawing and storing, and are answered in order; lookups
+    happen at fetch time, so a frame repeated within depth frames of itself is drawn again.
+    """
+    fetched, drawn, stored = asyncio.Queue(depth), asyncio.Queue(depth), asyncio.Queue(depth)
+    tasks = [
+        asyncio.create_task(_produce(components, fetched, _fetch)),
+        asyncio.create_task(_forward(fetched, drawn, _render)),
+        asyncio.create_task(_forward(drawn, stored, _store)),
+    ]
+    try:
+        while True:
+            item = await stored.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item[1]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
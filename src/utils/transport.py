@@ -0,0 +1,95 @@
+import threading
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class SharedFrameRing:
+    """
+    Ring of equally shaped frame slots in one shared-memory block.
+
+    The producer owns the ring and writes each frame into the next slot; consumers on
+    the same host attach by name and get NumPy views on the slots, so only a small
+    handle travels through Redis and drawing happens in place on the shared pixels.
+    """
+    # Blocks created by this process, which the resource tracker must keep tracking
+    created = set()
+
+    def __init__(self, memory, slots, shape, dtype, owner):
+        self.memory = memory
+        self.slots = slots
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = owner
+        self.cursor = 0
+        self.frames = np.ndarray((slots,) + self.shape, dtype=self.dtype, buffer=memory.buf)
+
+    @classmethod
+    def create(cls, slots, shape, dtype=np.uint8, name=None):
+        size = slots * int(np.prod(shape)) * np.dtype(dtype).itemsize
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        cls.created.add(memory.name)
+        return cls(memory, slots, shape, dtype, True)
+
+    @classmethod
+    def attach(cls, name, slots, shape, dtype):
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Before Python 3.13 attaching registers the block with the resource tracker,
+            # which would unlink the producer's memory when this process exits
+            memory = shared_memory.SharedMemory(name=name)
+            if memory.name not in cls.created:
+                resource_tracker.unregister(memory._name, "shared_memory")
+        return cls(memory, slots, shape, dtype, False)
+
+    def write(self, frame):
+        """
+        Copies a frame into the next slot and returns its handle.
+        """
+        slot = self.cursor
+        self.cursor = (slot + 1) % self.slots
+        np.copyto(self.frames[slot], frame)
+        return self.handle(slot)
+
+    def handle(self, slot):
+        return {
+            "name": self.memory.name,
+            "slot": slot,
+            "slots": self.slots,
+            "shape": list(self.shape),
+            "dtype": self.dtype.str,
+        }
+
+    def close(self):
+        self.frames = None
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            self.created.discard(self.memory.name)
+
+
+_rings = {}
+_rings_lock = threading.Lock()
+
+
+def attach_frame(handle):
+    """
+    Returns a writable view on the frame a handle points to. Rings stay attached per
+    process, so only the first frame of a ring pays for opening the shared memory.
+    """
+    name = handle["name"]
+    with _rings_lock:
+        ring = _rings.get(name)
+        if ring is None or ring.slots != handle["slots"] or list(ring.shape) != list(handle["shape"]):
+            if ring is not None:
+                ring.close()
+            ring = _rings[name] = SharedFrameRing.attach(name, handle["slots"], handle["shape"], handle["dtype"])
+    return ring.frames[handle["slot"]]
+
+
+def detach_all():
+    with _rings_lock:
+        for ring in _rings.values():
+            ring.close()
+        _rings.clear()
@@ -0,0 +1,73 @@
+from components.DrawBoundingRectangle.src.models.PackageModel import PackageModel, DrawBoundingRectangleInputs, Detection, ROI
+
+# Fields only a Detection carries; a list whose first element has none of them holds ROIs
+DETECTION_KEYS = frozenset(("classId", "classLabel", "confidence", "trackerID", "keyPoints", "angle", "rotatedBox", "mask"))
+
+
+def executor_request(data):
+    return data["configs"]["executor"]["value"]["value"]
+
+
+def is_strict(data):
+    option = executor_request(data)["configs"].get("configValidation") or {}
+    return (option.get("value") or {}).get("value") == "Strict"
+
+
+def check_detections(detections):
+    """
+    Checks the shape of inputDetections: a list of detection objects or a list of such
+    lists. Each list is discriminated as Detection or ROI once, by its first element,
+    and only that element is validated against the model; DetectionColumns reads the
+    remaining fields.
+    """
+    if not isinstance(detections, list):
+        raise ValueError(f"inputDetections must be a list, got {type(detections).__name__}.")
+    lists = detections if detections and isinstance(detections[0], list) else [detections]
+    for items in lists:
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise ValueError("inputDetections must hold detection objects, or one list of them per frame.")
+        if items:
+            model = Detection if DETECTION_KEYS.intersection(items[0]) else ROI
+            model.model_validate(items[0])
+
+
+def with_detections(inputs, detections):
+    return dict(inputs, inputDetections=dict(inputs["inputDetections"], value=detections))
+
+
+def with_inputs(data, inputs):
+    executor = data["configs"]["executor"]
+    option = executor["value"]
+    request = dict(option["value"], inputs=inputs)
+    return dict(data, configs=dict(data["configs"], executor=dict(executor, value=dict(option, value=request))))
+
+
+def validate_inputs(inputs, strict=False):
+    """
+    Validates the request inputs. Outside strict mode the detections are only
+    shape-checked and kept as the raw list.
+    """
+    if strict:
+        return DrawBoundingRectangleInputs.model_validate(inputs)
+    detections = inputs["inputDetections"]["value"]
+    check_detections(detections)
+    model = DrawBoundingRectangleInputs.model_validate(with_detections(inputs, []))
+    model.inputDetections.value = detections
+    return model
+
+
+def validate_request(data, strict=None):
+    """
+    Validates a request into a PackageModel. Configs and the image are always validated
+    strictly; the detections go through the full schema only when ConfigValidation is
+    Strict (or strict is passed), otherwise they are shape-checked and kept raw.
+    """
+    strict = is_strict(data) if strict is None else strict
+    if strict:
+        return PackageModel(**data)
+    inputs = executor_request(data)["inputs"]
+    detections = inputs["inputDetections"]["value"]
+    check_detections(detections)
+    model = PackageModel(**with_inputs(data, with_detections(inputs, [])))
+    model.configs.executor.value.value.inputs.inputDetections.value = detections
+    return model
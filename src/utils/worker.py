@@ -0,0 +1,178 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from pydantic import BaseModel
+
+from components.DrawBoundingRectangle.src.utils.metrics import registry as metrics_registry
+from components.DrawBoundingRectangle.src.utils.validation import executor_request, validate_request, validate_inputs
+
+# Validated request models kept per distinct static part of the request
+MODEL_CACHE_SIZE = 64
+
+
+class WorkerRequest:
+    """
+    Request handed to the component by a Worker. The model is already validated, so the
+    component skips PackageModel parsing; get_param reads a flat index of the model.
+    """
+    prevalidated = True
+
+    def __init__(self, data, model, params):
+        self.data = data
+        self.model = model
+        self.params = params
+
+    def get_param(self, name):
+        return self.params.get(name)
+
+
+def collect_params(model, params):
+    """
+    Indexes every named Config/Input of a validated model by name. Option values resolve
+    to the option's value, and configs nested inside an option are indexed as well.
+    """
+    for field in type(model).model_fields:
+        child = getattr(model, field)
+        if not isinstance(child, BaseModel):
+            continue
+        name, value = getattr(child, "name", None), getattr(child, "value", None)
+        if name is None or value is None:
+            continue
+        if isinstance(value, BaseModel) and getattr(value, "field", None) == "option":
+            params[name] = value.value
+            collect_params(value, params)
+        else:
+            params[name] = value
+    return params
+
+
+class Worker:
+    """
+    Long-lived host for a component.
+
+    The bootstrap state (palettes, color maps, geometry caches) stays resident across
+    requests. Everything but the inputs is validated once per distinct content and
+    reused; each request only validates its inputs (image reference and detections,
+    see validate_inputs) and grafts them onto the cached model.
+    """
+    def __init__(self, component, config=None):
+        self.component = component
+        self.bootstrap = component.bootstrap(config or {})
+        self.models = OrderedDict()
+
+    def request(self, data):
+        executor = executor_request(data)
+        inputs = executor.pop("inputs")
+        try:
+            digest = hashlib.blake2b(json.dumps(data, sort_keys=True).encode(), digest_size=16).digest()
+        finally:
+            executor["inputs"] = inputs
+
+        cached = self.models.get(digest)
+        if cached is None:
+            model = validate_request(data)
+            cached = self.models[digest] = (model, collect_params(model.configs.executor.value.value.configs, {}))
+            if len(self.models) > MODEL_CACHE_SIZE:
+                self.models.popitem(last=False)
+            input_model = model.configs.executor.value.value.inputs
+        else:
+            self.models.move_to_end(digest)
+            input_model = validate_inputs(inputs, cached[1].get("ConfigValidation") == "Strict")
+            model = self.with_inputs(cached[0], input_model)
+
+        params = dict(cached[1])
+        collect_params(input_model, params)
+        return WorkerRequest(data, model, params)
+
+    @staticmethod
+    def with_inputs(model, inputs):
+        """
+        Shallow copy of a validated PackageModel with the request inputs replaced.
+        """
+        executor = model.configs.executor
+        request = executor.value.value.model_copy(update={"inputs": inputs})
+        option = executor.value.model_copy(update={"value": request})
+        configs = model.configs.model_copy(update={"executor": executor.model_copy(update={"value": option})})
+        return model.model_copy(update={"configs": configs})
+
+    def handle(self, data):
+        return self.component(self.request(data), self.bootstrap).run()
+
+    def serve(self, lines=None, out=None):
+        """
+        Serves newline-delimited JSON requests, answering each with one JSON line.
+        A {"command": "metrics"} line is answered with {"metrics": <Prometheus text>}.
+        """
+        lines = sys.stdin if lines is None else lines
+        out = sys.stdout if out is None else out
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+                if data.get("command") == "metrics":
+                    response = json.dumps({"metrics": metrics_registry.to_prometheus()})
+                else:
+                    response = to_json(self.handle(data))
+            except Exception as exc:
+                response = json.dumps({"error": f"{type(exc).__name__}: {exc}"})
+            out.write(response + "\n")
+            out.flush()
+
+    def serve_queue(self, requests, responses):
+        """
+        Serves request dicts from a local queue until a None sentinel arrives.
+        """
+        while True:
+            data = requests.get()
+            if data is None:
+                break
+            try:
+                responses.put(self.handle(data))
+            except Exception as exc:
+                responses.put(exc)
+
+    @staticmethod
+    def serve_metrics(port, host="127.0.0.1"):
+        """
+        Serves the process-wide metrics registry as Prometheus text on GET /metrics from a
+        daemon thread. Returns the server; shutdown() stops it.
+        """
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics_registry.to_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep stdout/stderr free for the JSON-line protocol
+        pass
+
+
+def to_json(response):
+    if isinstance(response, BaseModel):
+        response = response.model_dump()
+    return json.dumps(response, default=encode_value)
+
+
+def encode_value(value):
+    # Frames travel through Redis or shared memory, never on the response line
+    if isinstance(value, np.ndarray):
+        return None
+    return str(value)